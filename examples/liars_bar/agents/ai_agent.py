@@ -4,25 +4,253 @@ AI Agent Implementation
 AI player using OpenRouter API with memory integration.
 """
 
+import asyncio
 import json
+import math
+import os
 import random
-import re
+from collections import Counter
 from typing import Union, Any
 
 import httpx
 
-from game.constants import GameMode, CardType, DECK_CLAIMABLE_TYPES
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# orjson is much faster for the small payloads we decode, but is optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+from game.constants import (
+    GameMode,
+    CardType,
+    CARD_ALIASES,
+    DECK_CARD_DISTRIBUTION,
+    DECK_CLAIMABLE_TYPES,
+    DICE_FACES,
+    ROULETTE_DEATH_PROB_LABELS,
+)
 from game.models import (
     Player,
     GameState,
     DeckAction,
     DiceAction,
 )
-from memory.memorize import retrieve_memories, create_challenge_event
+from game.roulette import death_probability
+from memory.memorize import (
+    retrieve_memories,
+    create_challenge_event,
+    queue_game_events,
+    drain_memorize_queue,
+)
 from .base_agent import BaseAgent
 from .personalities import get_agent_config, get_system_prompt, AgentConfig
 
 
+# Retry policy for transient OpenRouter failures
+LLM_MAX_ATTEMPTS = 3
+LLM_RETRY_STATUSES = frozenset({429, 502, 503})
+LLM_RETRY_BASE_DELAY = 0.5
+
+# Skip challenges whose bluff odds are below this once losing is this deadly
+FORCED_CAUTION_DEATH_PROB = 0.5
+FORCED_CAUTION_BLUFF_PROB = 0.2
+
+# Room for a one-line rationale plus the {"challenge": ...} object
+CHALLENGE_MAX_TOKENS = 150
+
+# Sampling temperatures for moves and for challenge decisions
+ACTION_TEMPERATURE = 0.7
+CHALLENGE_TEMPERATURE = 0.5
+
+# Compact JSON keeps prompts small; set LIARS_BAR_PRETTY_PROMPTS=1 when debugging
+_PROMPT_JSON_INDENT = 2 if os.getenv("LIARS_BAR_PRETTY_PROMPTS") else None
+_PROMPT_JSON_SEPARATORS = None if _PROMPT_JSON_INDENT else (",", ":")
+
+
+def _dump_prompt_json(value: Any) -> str:
+    """Serialize a prompt fragment as JSON"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if _PROMPT_JSON_INDENT else 0
+        return orjson.dumps(value, option=option).decode()
+    return json.dumps(value, indent=_PROMPT_JSON_INDENT, separators=_PROMPT_JSON_SEPARATORS)
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+# Structured output schemas - models that support them return bare JSON
+DECK_ACTION_SCHEMA: dict[str, Any] = {
+    "name": "deck_action",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "action": {"type": "string", "enum": ["play"]},
+            "cards": {
+                "type": "array",
+                "items": {"type": "string", "enum": ["Q", "K", "A", "JOKER"]}
+            },
+            "claim": {"type": "string", "enum": ["Q", "K", "A"]}
+        },
+        "required": ["action", "cards", "claim"],
+        "additionalProperties": False
+    }
+}
+
+DICE_ACTION_SCHEMA: dict[str, Any] = {
+    "name": "dice_action",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "action": {"type": "string", "enum": ["bid"]},
+            "count": {"type": "integer"},
+            "face": {"type": "integer"}
+        },
+        "required": ["action", "count", "face"],
+        "additionalProperties": False
+    }
+}
+
+CHALLENGE_SCHEMA: dict[str, Any] = {
+    "name": "challenge_decision",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "challenge": {"type": "boolean"}
+        },
+        "required": ["challenge"],
+        "additionalProperties": False
+    }
+}
+
+
+def _binomial_cdf_below(k: int, n: int, p: float) -> float:
+    """Probability of fewer than k successes in n trials"""
+    return sum(math.comb(n, i) * p ** i * (1 - p) ** (n - i) for i in range(min(k, n + 1)))
+
+
+class _JsonObjectDetector:
+    """Incrementally scans streamed text for the first complete JSON object"""
+
+    def __init__(self):
+        self.text = ""
+        self._pos = 0  # Next character to scan
+        self._start = -1  # Index of the opening brace being tracked
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: str) -> bool:
+        """Append a chunk; return True once a complete JSON object has been seen"""
+        self.text += chunk
+        text = self.text
+        i = self._pos
+
+        while i < len(text):
+            char = text[i]
+            i += 1
+
+            if self._start == -1:
+                if char == '{':
+                    self._start = i - 1
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char == '{':
+                self._depth += 1
+            elif char == '}':
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        parsed = json.loads(text[self._start:i])
+                    except json.JSONDecodeError:
+                        parsed = None
+                    if isinstance(parsed, dict):
+                        self._pos = i
+                        return True
+                    # Braces in prose - resume scanning after the false start
+                    i = self._start + 1
+                    self._start = -1
+
+        self._pos = i
+        return False
+
+
+# User prompt templates, filled with str.format_map per decision
+DECK_ACTION_PROMPT = """Current game state:
+- Round: {round_number}
+- Target card for this round: {current_round_claim}
+- Your hand: {hand}
+- Cards on table: {cards_on_table}
+- Roulette shots fired: {roulette_shots_fired}
+
+Players:
+{players}
+
+Recent actions this round:
+{recent_actions}
+
+{memories}
+
+What cards do you play and what do you claim? You must play 1-3 cards.
+Respond with JSON: {{"action": "play", "cards": ["Q", "K"], "claim": "K"}}"""
+
+DICE_ACTION_PROMPT = """Current game state:
+- Round: {round_number}
+- Your dice: {dice}
+- Current bid: {current_bid}
+- Active players: {active_players}
+- Roulette shots fired: {roulette_shots_fired}
+
+Players:
+{players}
+
+Recent bids:
+{recent_actions}
+
+{memories}
+
+Make your bid. It must be higher than the current bid.
+Respond with JSON: {{"action": "bid", "count": 3, "face": 5}}"""
+
+CHALLENGE_PROMPT = """Previous player {player_id} {action_desc}.
+
+Your situation:
+- Your hand/dice: {hand_or_dice}
+- Roulette shots fired: {roulette_shots_fired} (higher = more dangerous)
+- Death probability if you lose: {death_prob}
+
+{memories}
+
+Should you challenge and call "LIAR!"?
+- If correct: they play roulette
+- If wrong: YOU play roulette
+
+Respond with JSON: {{"challenge": true}} or {{"challenge": false}}"""
+
+
 class AIAgent(BaseAgent):
     """
     AI player that uses OpenRouter API for decision making.
@@ -33,11 +261,16 @@ class AIAgent(BaseAgent):
     - Different LLM models for each agent
     """
 
+    # One connection pool shared by every agent, released by the last user
+    _shared_client: httpx.AsyncClient | None = None
+    _shared_client_users: int = 0
+
     def __init__(
         self,
         player: Player,
         api_key: str,
         agent_key: str,
+        seed: int | None = None,
     ):
         """
         Initialize the AI agent.
@@ -46,6 +279,7 @@ class AIAgent(BaseAgent):
             player: Player model
             api_key: OpenRouter API key
             agent_key: Key to agent configuration (claude, gpt, llama)
+            seed: Optional seed for the agent's fallback decisions
 
         Raises:
             ValueError: If agent_key is not a valid configuration key
@@ -54,22 +288,66 @@ class AIAgent(BaseAgent):
         self.api_key = api_key
         self.agent_key = agent_key
 
+        # Private RNG for fallback decisions (reproducible when seeded)
+        self._rng = random.Random(seed)
+
         config = get_agent_config(agent_key)
         if config is None:
             raise ValueError(f"Invalid agent_key: {agent_key}. Valid keys are: claude, gpt, llama")
         self.config: AgentConfig = config
 
         self.model_id = self.config["model_id"]
+        self.challenge_model_id = self.config.get("challenge_model_id", self.model_id)
+
+        # Identical bytes every turn keep the provider's prompt cache warm
+        self.system_prompt = get_system_prompt(agent_key)
         self.base_url = "https://openrouter.ai/api/v1"
 
+        # Persistent client so every decision reuses pooled keep-alive connections
+        self._client = AIAgent._acquire_client(self.base_url)
+        self._client_closed = False
+        self._auth_headers = {"Authorization": f"Bearer {self.api_key}"}
+
         # Track events for memorization
         self.game_events: list[dict[str, Any]] = []
 
+    def _build_messages(
+        self,
+        model_id: str,
+        system_prompt: str,
+        user_prompt: str
+    ) -> list[dict[str, Any]]:
+        """
+        Build the chat messages with the static system prompt first.
+
+        The system prompt never changes during a game, so keeping it as the
+        leading block lets providers reuse their cached prefix. Anthropic
+        models need an explicit cache_control marker; others cache implicitly.
+        """
+        if model_id.startswith("anthropic/"):
+            system_message: dict[str, Any] = {
+                "role": "system",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": {"type": "ephemeral"}
+                    }
+                ]
+            }
+        else:
+            system_message = {"role": "system", "content": system_prompt}
+
+        return [system_message, {"role": "user", "content": user_prompt}]
+
     async def _query_llm(
         self,
         system_prompt: str,
         user_prompt: str,
-        temperature: float = 0.7
+        temperature: float = ACTION_TEMPERATURE,
+        model_id: str | None = None,
+        max_tokens: int = 500,
+        response_schema: dict[str, Any] | None = None
     ) -> str:
         """
         Query the LLM via OpenRouter API.
@@ -78,58 +356,152 @@ class AIAgent(BaseAgent):
             system_prompt: System message
             user_prompt: User message
             temperature: Sampling temperature
+            model_id: Model to use (defaults to the agent's main model)
+            max_tokens: Maximum tokens to generate
+            response_schema: JSON schema to constrain the output to
 
         Returns:
             LLM response text
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                        "HTTP-Referer": "https://liars-bar-game.local",
-                        "X-Title": "Liars Bar Game"
-                    },
-                    json={
-                        "model": self.model_id,
-                        "messages": [
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": user_prompt}
-                        ],
-                        "temperature": temperature,
-                        "max_tokens": 500
-                    },
-                    timeout=30.0
-                )
+        model_id = model_id or self.model_id
 
-                if response.status_code != 200:
-                    print(f"[AI] API error: {response.status_code} - {response.text}")
-                    return ""
+        try:
+            payload: dict[str, Any] = {
+                "model": model_id,
+                "messages": self._build_messages(model_id, system_prompt, user_prompt),
+                "temperature": temperature,
+                "max_tokens": max_tokens
+            }
+            if response_schema is not None:
+                payload["response_format"] = {
+                    "type": "json_schema",
+                    "json_schema": response_schema
+                }
+
+            payload["stream"] = True
+
+            for attempt in range(LLM_MAX_ATTEMPTS):
+                is_last_attempt = attempt == LLM_MAX_ATTEMPTS - 1
+                try:
+                    # Stream the answer and hang up as soon as the JSON object is complete
+                    async with self._client.stream(
+                        "POST",
+                        "/chat/completions",
+                        headers=self._auth_headers,
+                        json=payload
+                    ) as response:
+                        if response.status_code != 200:
+                            await response.aread()
+                            if response.status_code in LLM_RETRY_STATUSES and not is_last_attempt:
+                                await self._backoff(attempt)
+                                continue
+                            print(f"[AI] API error: {response.status_code} - {response.text}")
+                            return ""
+
+                        content = await self._read_stream(response)
+
+                except httpx.TimeoutException:
+                    if is_last_attempt:
+                        raise
+                    await self._backoff(attempt)
+                    continue
+
+                return content
+
+            return ""
+
+        except Exception as e:
+            print(f"[AI] Query failed: {e}")
+            return ""
+
+    @staticmethod
+    async def _backoff(attempt: int) -> None:
+        """Sleep with exponential backoff and jitter before retrying"""
+        delay = LLM_RETRY_BASE_DELAY * (2 ** attempt)
+        await asyncio.sleep(delay + random.uniform(0, delay))
+
+    async def _read_stream(self, response: httpx.Response) -> str:
+        """
+        Accumulate streamed content deltas from a server-sent event response.
 
-                data = response.json()
+        Stops reading once the text contains a complete JSON object, since
+        anything the model writes after its answer is discarded anyway.
+        """
+        detector = _JsonObjectDetector()
 
-                # Safely extract content from response
-                choices = data.get("choices")
-                if not choices or not isinstance(choices, list) or len(choices) == 0:
-                    print(f"[AI] Invalid response: no choices in response")
-                    return ""
+        async for line in response.aiter_lines():
+            # Skip keep-alive comments and blank separators
+            if not line.startswith("data:"):
+                continue
 
-                message = choices[0].get("message")
-                if not message or not isinstance(message, dict):
-                    print(f"[AI] Invalid response: no message in choice")
-                    return ""
+            data_str = line[5:].strip()
+            if data_str == "[DONE]":
+                break
 
-                content = message.get("content", "")
-                return content if isinstance(content, str) else ""
+            try:
+                data = orjson.loads(data_str) if ORJSON_AVAILABLE else json.loads(data_str)
+            except ValueError:
+                continue
 
-            except Exception as e:
-                print(f"[AI] Query failed: {e}")
-                return ""
+            # Safely extract content from the chunk
+            choices = data.get("choices") if isinstance(data, dict) else None
+            if not choices or not isinstance(choices, list):
+                continue
+
+            delta = choices[0].get("delta")
+            if not delta or not isinstance(delta, dict):
+                continue
+
+            content = delta.get("content")
+            if isinstance(content, str) and content and detector.feed(content):
+                break
+
+        return detector.text
+
+    @classmethod
+    async def wait_for_background_tasks(cls) -> None:
+        """Wait for all queued background memorization to finish"""
+        await drain_memorize_queue()
+
+    @classmethod
+    def _acquire_client(cls, base_url: str) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it if needed"""
+        if cls._shared_client is None or cls._shared_client.is_closed:
+            cls._shared_client = httpx.AsyncClient(
+                base_url=base_url,
+                headers={
+                    "Content-Type": "application/json",
+                    "HTTP-Referer": "https://liars-bar-game.local",
+                    "X-Title": "Liars Bar Game"
+                },
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                # Multiplex concurrent agent requests over one connection when
+                # HTTP/2 is available; the transport also retries failed connects
+                transport=httpx.AsyncHTTPTransport(
+                    http2=HTTP2_AVAILABLE,
+                    retries=3,
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+                )
+            )
+            cls._shared_client_users = 0
+        cls._shared_client_users += 1
+        return cls._shared_client
+
+    async def aclose(self) -> None:
+        """Release the shared HTTP client, closing it once no agent uses it"""
+        if self._client_closed:
+            return
+        self._client_closed = True
+
+        AIAgent._shared_client_users -= 1
+        if AIAgent._shared_client_users <= 0 and AIAgent._shared_client is self._client:
+            AIAgent._shared_client = None
+            AIAgent._shared_client_users = 0
+            await self._client.aclose()
 
     async def _get_memories(self, query: str) -> str:
         """Retrieve relevant memories and format them"""
+        # retrieve_memories caches per (agent, query) until the agent memorizes
         memories = await retrieve_memories(query, self.player_id, top_k=5)
 
         if not memories:
@@ -145,53 +517,32 @@ class AIAgent(BaseAgent):
 
     def _parse_json_from_response(self, response: str) -> dict[str, Any]:
         """Extract JSON from LLM response, handling nested structures"""
-        # Try parsing the whole response first
-        try:
-            return json.loads(response)
-        except json.JSONDecodeError:
-            pass
-
-        # Find JSON by matching balanced braces
+        # Decode the first JSON object in place - raw_decode scans linearly
+        # in C and stops at the matching brace, ignoring the surrounding prose
         start_idx = response.find('{')
         if start_idx == -1:
             return {}
 
-        # Track brace depth to find complete JSON object
-        depth = 0
-        end_idx = start_idx
-        in_string = False
-        escape_next = False
-
-        for i, char in enumerate(response[start_idx:], start=start_idx):
-            if escape_next:
-                escape_next = False
-                continue
-
-            if char == '\\' and in_string:
-                escape_next = True
-                continue
-
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-
-            if in_string:
-                continue
-
-            if char == '{':
-                depth += 1
-            elif char == '}':
-                depth -= 1
-                if depth == 0:
-                    end_idx = i
-                    break
+        # Common case: the answer ends with the JSON object
+        if ORJSON_AVAILABLE:
+            end_idx = response.rfind('}')
+            try:
+                parsed = orjson.loads(response[start_idx:end_idx + 1])
+            except orjson.JSONDecodeError:
+                parsed = None
+            if isinstance(parsed, dict):
+                return parsed
 
-        if depth == 0 and end_idx > start_idx:
-            json_str = response[start_idx:end_idx + 1]
+        while start_idx != -1:
             try:
-                return json.loads(json_str)
+                parsed, _ = _JSON_DECODER.raw_decode(response, start_idx)
             except json.JSONDecodeError:
-                pass
+                parsed = None
+
+            if isinstance(parsed, dict):
+                return parsed
+
+            start_idx = response.find('{', start_idx + 1)
 
         return {}
 
@@ -204,29 +555,32 @@ class AIAgent(BaseAgent):
 
     async def _decide_deck_action(self, state: GameState) -> DeckAction:
         """Decide action for Liar's Deck mode"""
-        visible_state = self.get_visible_state(state)
-        memories = await self._get_memories("deck bluffing strategy card game")
-
-        system_prompt = get_system_prompt(self.agent_key)
-        user_prompt = f"""Current game state:
-- Round: {visible_state['round_number']}
-- Target card for this round: {visible_state['current_round_claim']}
-- Your hand: {[c.value for c in self.player.hand]}
-- Cards on table: {visible_state['cards_on_table']}
-- Roulette shots fired: {visible_state['roulette_shots_fired']}
-
-Players:
-{json.dumps(visible_state['players'], indent=2)}
-
-Recent actions this round:
-{json.dumps(visible_state['action_history'][-5:], indent=2)}
-
-{memories}
-
-What cards do you play and what do you claim? You must play 1-3 cards.
-Respond with JSON: {{"action": "play", "cards": ["Q", "K"], "claim": "K"}}"""
-
-        response = await self._query_llm(system_prompt, user_prompt)
+        # Memory retrieval is independent of the game state, so start it first
+        # and yield once so its request is in flight while the prompt is built
+        memories_task = asyncio.create_task(
+            self._get_memories("deck bluffing strategy card game")
+        )
+        await asyncio.sleep(0)
+        view = self.get_deck_view(state)
+        system_prompt = self.system_prompt
+        memories = await memories_task
+        user_prompt = DECK_ACTION_PROMPT.format_map({
+            "round_number": view["round_number"],
+            "current_round_claim": view["current_round_claim"],
+            "hand": [c.value for c in self.player.hand],
+            "cards_on_table": view["cards_on_table"],
+            "roulette_shots_fired": view["roulette_shots_fired"],
+            "players": _dump_prompt_json(view["players"]),
+            "recent_actions": _dump_prompt_json(view["recent_actions"]),
+            "memories": memories,
+        })
+
+        response = await self._query_llm(
+            system_prompt,
+            user_prompt,
+            temperature=ACTION_TEMPERATURE,
+            response_schema=DECK_ACTION_SCHEMA
+        )
         parsed = self._parse_json_from_response(response)
 
         # Parse or fallback to random action
@@ -234,7 +588,7 @@ Respond with JSON: {{"action": "play", "cards": ["Q", "K"], "claim": "K"}}"""
 
     def _create_deck_action(self, parsed: dict, state: GameState) -> DeckAction:
         """Create a DeckAction from parsed response or generate random"""
-        target = state.current_round_claim or random.choice(DECK_CLAIMABLE_TYPES)
+        target = state.current_round_claim or self._rng.choice(DECK_CLAIMABLE_TYPES)
 
         # Try to use parsed response
         if parsed.get("action") == "play" and "cards" in parsed:
@@ -245,34 +599,22 @@ Respond with JSON: {{"action": "play", "cards": ["Q", "K"], "claim": "K"}}"""
                 # Parse cards
                 cards = []
                 for c in cards_str[:3]:  # Max 3 cards
-                    card_upper = c.upper()
-                    if card_upper in ["Q", "QUEEN"]:
-                        cards.append(CardType.QUEEN)
-                    elif card_upper in ["K", "KING"]:
-                        cards.append(CardType.KING)
-                    elif card_upper in ["A", "ACE"]:
-                        cards.append(CardType.ACE)
-                    elif card_upper in ["JOKER", "J"]:
-                        cards.append(CardType.JOKER)
+                    card = CARD_ALIASES.get(c.upper())
+                    if card is not None:
+                        cards.append(card)
 
                 # Validate cards are in hand
-                hand_copy = self.player.hand.copy()
+                remaining = Counter(self.player.hand)
                 valid_cards = []
                 for card in cards:
-                    if card in hand_copy:
+                    if remaining[card] > 0:
                         valid_cards.append(card)
-                        hand_copy.remove(card)
+                        remaining[card] -= 1
 
                 if valid_cards:
-                    # Parse claim
-                    claim_upper = claim_str.upper()
-                    if claim_upper in ["Q", "QUEEN"]:
-                        claim = CardType.QUEEN
-                    elif claim_upper in ["K", "KING"]:
-                        claim = CardType.KING
-                    elif claim_upper in ["A", "ACE"]:
-                        claim = CardType.ACE
-                    else:
+                    # Parse claim (Jokers can't be claimed)
+                    claim = CARD_ALIASES.get(claim_str.upper(), target)
+                    if claim not in DECK_CLAIMABLE_TYPES:
                         claim = target
 
                     return DeckAction.create(self.player_id, valid_cards, claim)
@@ -285,7 +627,7 @@ Respond with JSON: {{"action": "play", "cards": ["Q", "K"], "claim": "K"}}"""
 
     def _random_deck_action(self, state: GameState) -> DeckAction:
         """Generate a random deck action based on personality"""
-        target = state.current_round_claim or random.choice(DECK_CLAIMABLE_TYPES)
+        target = state.current_round_claim or self._rng.choice(DECK_CLAIMABLE_TYPES)
         hand = self.player.hand.copy()
 
         if not hand:
@@ -294,18 +636,18 @@ Respond with JSON: {{"action": "play", "cards": ["Q", "K"], "claim": "K"}}"""
 
         # Decide how many cards to play (1-3)
         max_cards = min(3, len(hand))
-        num_cards = random.randint(1, max_cards)
+        num_cards = self._rng.randint(1, max_cards)
 
         # Based on bluff tendency, decide whether to bluff
         bluff_tendency = self.config.get("bluff_tendency", 0.5)
-        should_bluff = random.random() < bluff_tendency
+        should_bluff = self._rng.random() < bluff_tendency
 
         # Find matching cards
-        matching = [c for c in hand if c == target or c == CardType.JOKER]
+        matching = [c for c in hand if c is target or c is CardType.JOKER]
 
         if should_bluff or len(matching) < num_cards:
             # Bluff: play random cards and claim they match
-            cards = random.sample(hand, num_cards)
+            cards = self._rng.sample(hand, num_cards)
         else:
             # Truth: play matching cards
             cards = matching[:num_cards]
@@ -314,35 +656,37 @@ Respond with JSON: {{"action": "play", "cards": ["Q", "K"], "claim": "K"}}"""
 
     async def _decide_dice_action(self, state: GameState) -> DiceAction:
         """Decide action for Liar's Dice mode"""
-        visible_state = self.get_visible_state(state)
-        memories = await self._get_memories("dice bidding bluffing strategy")
-
-        system_prompt = get_system_prompt(self.agent_key)
+        memories_task = asyncio.create_task(
+            self._get_memories("dice bidding bluffing strategy")
+        )
+        await asyncio.sleep(0)
+        view = self.get_dice_view(state)
+        system_prompt = self.system_prompt
 
         current_bid_str = "No current bid - you start"
-        if visible_state["current_bid"]:
-            cb = visible_state["current_bid"]
+        if view["current_bid"]:
+            cb = view["current_bid"]
             current_bid_str = f"{cb['count']}x {cb['face']}'s by {cb['player_id']}"
 
-        user_prompt = f"""Current game state:
-- Round: {visible_state['round_number']}
-- Your dice: {self.player.dice}
-- Current bid: {current_bid_str}
-- Active players: {len([p for p in visible_state['players'] if p['is_alive']])}
-- Roulette shots fired: {visible_state['roulette_shots_fired']}
-
-Players:
-{json.dumps(visible_state['players'], indent=2)}
-
-Recent bids:
-{json.dumps(visible_state['action_history'][-5:], indent=2)}
-
-{memories}
-
-Make your bid. It must be higher than the current bid.
-Respond with JSON: {{"action": "bid", "count": 3, "face": 5}}"""
-
-        response = await self._query_llm(system_prompt, user_prompt)
+        memories = await memories_task
+
+        user_prompt = DICE_ACTION_PROMPT.format_map({
+            "round_number": view["round_number"],
+            "dice": self.player.dice,
+            "current_bid": current_bid_str,
+            "active_players": sum(1 for p in view["players"] if p["is_alive"]),
+            "roulette_shots_fired": view["roulette_shots_fired"],
+            "players": _dump_prompt_json(view["players"]),
+            "recent_actions": _dump_prompt_json(view["recent_actions"]),
+            "memories": memories,
+        })
+
+        response = await self._query_llm(
+            system_prompt,
+            user_prompt,
+            temperature=ACTION_TEMPERATURE,
+            response_schema=DICE_ACTION_SCHEMA
+        )
         parsed = self._parse_json_from_response(response)
 
         return self._create_dice_action(parsed, state)
@@ -380,21 +724,23 @@ Respond with JSON: {{"action": "bid", "count": 3, "face": 5}}"""
         if current is None:
             # First bid: start conservatively
             my_dice = self.player.dice
-            most_common = max(set(my_dice), key=my_dice.count) if my_dice else 3
-            count = my_dice.count(most_common) if my_dice else 1
+            if my_dice:
+                face, count = Counter(my_dice).most_common(1)[0]
+            else:
+                face, count = 3, 1
             return DiceAction(
                 player_id=self.player_id,
                 bid_count=max(1, count),
-                bid_face=most_common
+                bid_face=face
             )
 
         # Raise the bid
         bluff_tendency = self.config.get("bluff_tendency", 0.5)
 
-        if random.random() < bluff_tendency:
+        if self._rng.random() < bluff_tendency:
             # Aggressive raise
-            count = current.bid_count + random.randint(1, 2)
-            face = random.randint(current.bid_face, 6)
+            count = current.bid_count + self._rng.randint(1, 2)
+            face = self._rng.randint(current.bid_face, 6)
         else:
             # Conservative raise
             if current.bid_face < 6:
@@ -402,7 +748,7 @@ Respond with JSON: {{"action": "bid", "count": 3, "face": 5}}"""
                 face = current.bid_face + 1
             else:
                 count = current.bid_count + 1
-                face = random.randint(1, 6)
+                face = self._rng.randint(1, 6)
 
         return DiceAction(
             player_id=self.player_id,
@@ -410,40 +756,101 @@ Respond with JSON: {{"action": "bid", "count": 3, "face": 5}}"""
             bid_face=face
         )
 
+    def _forced_challenge_decision(
+        self,
+        state: GameState,
+        last_action: Union[DeckAction, DiceAction]
+    ) -> bool | None:
+        """
+        Decide a challenge without the LLM when the outcome is (nearly) certain.
+
+        Returns:
+            True/False if the decision is forced, None to ask the LLM
+        """
+        if isinstance(last_action, DeckAction):
+            # Matching cards we hold or have already played this round can't be
+            # in the claimed play; claiming more than the rest is a sure bluff
+            claimed = last_action.claimed_type
+            total = DECK_CARD_DISTRIBUTION[claimed] + DECK_CARD_DISTRIBUTION[CardType.JOKER]
+            known = sum(1 for c in self.player.hand if c is claimed or c is CardType.JOKER)
+            known += sum(
+                1
+                for action in state.deck_actions if action.player_id == self.player_id
+                for c in action.cards_played if c is claimed or c is CardType.JOKER
+            )
+            if last_action.cards_count > total - known:
+                return True
+            return None
+
+        # Dice: our own dice settle part of the bid, the rest is binomial
+        needed = last_action.bid_count - self.player.dice.count(last_action.bid_face)
+        if needed <= 0:
+            return False  # The bid is already true with our dice alone
+
+        other_dice = sum(
+            len(p.dice) for p in state.players
+            if p.is_alive() and p.id != self.player_id
+        )
+        if needed > other_dice:
+            return True  # Not enough dice left in play to make the bid
+
+        # Don't risk a nearly hopeless challenge when losing is likely fatal
+        if state.roulette:
+            death_prob = death_probability(state.roulette.chambers, state.roulette.shots_fired)
+            if death_prob >= FORCED_CAUTION_DEATH_PROB:
+                bluff_prob = _binomial_cdf_below(needed, other_dice, 1 / DICE_FACES)
+                if bluff_prob < FORCED_CAUTION_BLUFF_PROB:
+                    return False
+
+        return None
+
     async def decide_challenge(
         self,
         state: GameState,
         last_action: Union[DeckAction, DiceAction]
     ) -> bool:
         """Decide whether to challenge the previous player"""
-        visible_state = self.get_visible_state(state)
-        memories = await self._get_memories(
-            f"challenge bluff detection {last_action.player_id}"
-        )
+        # Skip the LLM entirely when the answer follows from what we can see
+        forced = self._forced_challenge_decision(state, last_action)
+        if forced is not None:
+            return forced
 
-        system_prompt = get_system_prompt(self.agent_key)
+        memories_task = asyncio.create_task(
+            self._get_memories(f"challenge bluff detection {last_action.player_id}")
+        )
+        await asyncio.sleep(0)
+        shots_fired = state.roulette.shots_fired if state.roulette else 0
+        system_prompt = self.system_prompt
 
         if state.mode == GameMode.LIARS_DECK:
             action_desc = f"played {last_action.cards_count} card(s) claiming {last_action.claimed_type.value}"
         else:
             action_desc = f"bid {last_action.bid_count}x {last_action.bid_face}'s"
 
-        user_prompt = f"""Previous player {last_action.player_id} {action_desc}.
-
-Your situation:
-- Your hand/dice: {self.player.hand if state.mode == GameMode.LIARS_DECK else self.player.dice}
-- Roulette shots fired: {visible_state['roulette_shots_fired']} (higher = more dangerous)
-- Death probability if you lose: {(visible_state['roulette_shots_fired'] + 1) / 6 * 100:.0f}%
-
-{memories}
-
-Should you challenge and call "LIAR!"?
-- If correct: they play roulette
-- If wrong: YOU play roulette
-
-Respond with JSON: {{"challenge": true}} or {{"challenge": false}}"""
-
-        response = await self._query_llm(system_prompt, user_prompt, temperature=0.5)
+        memories = await memories_task
+
+        user_prompt = CHALLENGE_PROMPT.format_map({
+            "player_id": last_action.player_id,
+            "action_desc": action_desc,
+            "hand_or_dice": (
+                [c.value for c in self.player.hand]
+                if state.mode == GameMode.LIARS_DECK
+                else self.player.dice
+            ),
+            "roulette_shots_fired": shots_fired,
+            "death_prob": ROULETTE_DEATH_PROB_LABELS[min(shots_fired, len(ROULETTE_DEATH_PROB_LABELS) - 1)],
+            "memories": memories,
+        })
+
+        # A yes/no decision doesn't need the main model
+        response = await self._query_llm(
+            system_prompt,
+            user_prompt,
+            temperature=CHALLENGE_TEMPERATURE,
+            model_id=self.challenge_model_id,
+            max_tokens=CHALLENGE_MAX_TOKENS,
+            response_schema=CHALLENGE_SCHEMA
+        )
         parsed = self._parse_json_from_response(response)
 
         # Parse or use personality-based decision
@@ -454,10 +861,9 @@ Respond with JSON: {{"challenge": true}} or {{"challenge": false}}"""
         challenge_tendency = self.config.get("challenge_tendency", 0.5)
 
         # Adjust based on roulette danger
-        shots_fired = state.roulette.shots_fired if state.roulette else 0
         danger_modifier = shots_fired * 0.1  # More cautious as danger increases
 
-        return random.random() < (challenge_tendency - danger_modifier)
+        return self._rng.random() < (challenge_tendency - danger_modifier)
 
     async def on_challenge(
         self,
@@ -481,8 +887,9 @@ Respond with JSON: {{"challenge": true}} or {{"challenge": false}}"""
 
     async def on_game_over(self, winner_id: str, state: GameState) -> None:
         """Memorize game events at end of game"""
-        from memory.memorize import memorize_game_events
-
         if self.game_events:
-            await memorize_game_events(self.game_events, self.player_id)
+            # Hand off to the memorize queue so game teardown isn't blocked
+            queue_game_events(self.game_events, self.player_id)
             self.game_events = []
+
+        await self.aclose()
@@ -5,7 +5,7 @@ Abstract base class for all players (human and AI).
 """
 
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import Any, Union
 
 from game.constants import GameMode
 from game.models import (
@@ -15,6 +15,9 @@ from game.models import (
     DiceAction,
 )
 
+# Number of recent actions shown in decision views
+RECENT_ACTIONS = 5
+
 
 class BaseAgent(ABC):
     """
@@ -32,6 +35,11 @@ class BaseAgent(ABC):
         """
         self.player = player
 
+        # Incrementally maintained projections of the append-only histories
+        self._action_history_key: tuple[Any, ...] | None = None
+        self._action_history: list[dict] = []
+        self._challenge_history: list[dict] = []
+
     @property
     def player_id(self) -> str:
         """Get the player's ID"""
@@ -186,6 +194,14 @@ class BaseAgent(ABC):
         """
         pass
 
+    async def aclose(self) -> None:
+        """
+        Release any resources held by the agent.
+
+        Override to close connections, threads, etc.
+        """
+        pass
+
     def get_visible_state(self, state: GameState) -> dict:
         """
         Get the game state visible to this player.
@@ -222,6 +238,7 @@ class BaseAgent(ABC):
             }
 
         # Add player info (without hidden cards/dice)
+        current_id = state.get_current_player().id
         for p in state.players:
             player_info = {
                 "id": p.id,
@@ -229,29 +246,108 @@ class BaseAgent(ABC):
                 "is_alive": p.is_alive(),
                 "bullets_survived": p.bullets_survived,
                 "cards_in_hand": len(p.hand) if state.mode == GameMode.LIARS_DECK else None,
-                "is_current": p.id == state.get_current_player().id,
+                "is_current": p.id == current_id,
             }
             visible["players"].append(player_info)
 
-        # Add action history (without revealing actual cards)
+        # Histories only grow, so just project the entries added since last call
+        visible["action_history"] = list(self._project_action_history(state))
+        visible["challenge_history"] = list(self._project_challenge_history(state))
+
+        return visible
+
+    def get_deck_view(self, state: GameState) -> dict:
+        """
+        Get the minimal visible state needed for a Liar's Deck decision.
+
+        Args:
+            state: Full game state
+
+        Returns:
+            Dictionary with only the fields the deck prompt uses
+        """
+        return {
+            "round_number": state.round_number,
+            "current_round_claim": state.current_round_claim.value if state.current_round_claim else None,
+            "cards_on_table": state.cards_on_table,
+            "roulette_shots_fired": state.roulette.shots_fired if state.roulette else 0,
+            "players": [
+                {"id": p.id, "is_alive": p.is_alive(), "cards_in_hand": len(p.hand)}
+                for p in state.players
+            ],
+            "recent_actions": self._project_action_history(state)[-RECENT_ACTIONS:],
+        }
+
+    def get_dice_view(self, state: GameState) -> dict:
+        """
+        Get the minimal visible state needed for a Liar's Dice decision.
+
+        Args:
+            state: Full game state
+
+        Returns:
+            Dictionary with only the fields the dice prompt uses
+        """
+        current_bid = None
+        if state.current_bid:
+            current_bid = {
+                "player_id": state.current_bid.player_id,
+                "count": state.current_bid.bid_count,
+                "face": state.current_bid.bid_face
+            }
+
+        return {
+            "round_number": state.round_number,
+            "current_bid": current_bid,
+            "roulette_shots_fired": state.roulette.shots_fired if state.roulette else 0,
+            "players": [{"id": p.id, "is_alive": p.is_alive()} for p in state.players],
+            "recent_actions": self._project_action_history(state)[-RECENT_ACTIONS:],
+        }
+
+    def _project_action_history(self, state: GameState) -> list[dict]:
+        """Update the cached action history view (without revealing actual cards)"""
+        actions: list[DeckAction] | list[DiceAction]
         if state.mode == GameMode.LIARS_DECK:
-            for action in state.deck_actions:
-                visible["action_history"].append({
+            actions = state.deck_actions
+        else:
+            actions = state.dice_actions
+
+        if not actions:
+            self._action_history_key = None
+            self._action_history = []
+            return self._action_history
+
+        # A new round starts a fresh list - detect it by its first action
+        first = actions[0]
+        key = (state.mode, first.player_id, first.timestamp)
+        if key != self._action_history_key or len(actions) < len(self._action_history):
+            self._action_history_key = key
+            self._action_history = []
+
+        for action in actions[len(self._action_history):]:
+            if isinstance(action, DeckAction):
+                self._action_history.append({
                     "player_id": action.player_id,
                     "cards_count": action.cards_count,
                     "claimed_type": action.claimed_type.value,
                 })
-        else:
-            for action in state.dice_actions:
-                visible["action_history"].append({
+            else:
+                self._action_history.append({
                     "player_id": action.player_id,
                     "bid_count": action.bid_count,
                     "bid_face": action.bid_face,
                 })
 
-        # Add challenge history
-        for challenge in state.challenge_history:
-            visible["challenge_history"].append({
+        return self._action_history
+
+    def _project_challenge_history(self, state: GameState) -> list[dict]:
+        """Update the cached challenge history view"""
+        challenges = state.challenge_history
+        if len(challenges) < len(self._challenge_history):
+            self._challenge_history = []
+
+        for challenge in challenges[len(self._challenge_history):]:
+            self._challenge_history.append({
                 "challenger_id": challenge.challenger_id,
                 "challenged_id": challenge.challenged_id,
                 "was_bluff": challenge.was_bluff,
@@ -259,4 +355,4 @@ class BaseAgent(ABC):
                 "result": challenge.roulette_result,
             })
 
-        return visible
+        return self._challenge_history
@@ -5,18 +5,62 @@ Terminal-based human player with input prompts.
 """
 
 import asyncio
+import atexit
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 
-from game.constants import GameMode, CardType, DECK_CLAIMABLE_TYPES
+from game.constants import (
+    GameMode,
+    CardType,
+    CARD_ALIASES,
+    DECK_CLAIMABLE_TYPES,
+    ROULETTE_DEATH_PROB_LABELS,
+)
 from game.models import (
     Player,
     GameState,
     DeckAction,
     DiceAction,
 )
+from game.dice_mode import LiarsDice
 from .base_agent import BaseAgent
 
 
+# Whitespace-separated card numbers, e.g. "1 3"
+_CARDS_INPUT_RE = re.compile(r"\s*\d+(?:\s+\d+)*\s*")
+
+# Spellings a human may use for a claim (jokers can't be claimed)
+_CLAIM_MAP = {
+    alias: card for alias, card in CARD_ALIASES.items()
+    if card in DECK_CLAIMABLE_TYPES
+}
+
+# Display text per card, so rendering skips the enum .value descriptor
+_CARD_STR = {card: card.value for card in CardType}
+
+# Banner rules for the event messages
+_BAR50 = "=" * 50
+_BANG50 = "!" * 50
+_X50 = "X" * 50
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write a whole message to stdout in one call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _stdin_is_tty() -> bool:
+    """Check whether stdin is an interactive terminal"""
+    try:
+        return sys.stdin.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
 class HumanPlayer(BaseAgent):
     """
     Human player that takes input from the terminal.
@@ -31,11 +75,86 @@ class HumanPlayer(BaseAgent):
         """
         super().__init__(player)
 
+        # One long-lived thread for blocking terminal reads, started on first use
+        self._io_executor: ThreadPoolExecutor | None = None
+
+        # On POSIX terminals, wait for stdin on the event loop instead
+        self._use_async_stdin = sys.platform != "win32" and _stdin_is_tty()
+
     async def _get_input(self, prompt: str) -> str:
         """Get input from user asynchronously"""
-        # Run input in thread pool to not block
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: input(prompt).strip())
+        if self._use_async_stdin:
+            try:
+                return (await self._read_stdin_line(prompt)).strip()
+            except NotImplementedError:
+                # Event loop can't watch file descriptors (e.g. Proactor)
+                self._use_async_stdin = False
+
+        # Run input on the dedicated thread to not block the event loop
+        loop = asyncio.get_running_loop()
+        line = await loop.run_in_executor(self._get_io_executor(), input, prompt)
+        return line.strip()
+
+    def _get_io_executor(self) -> ThreadPoolExecutor:
+        """Create the input thread's executor on first use"""
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=f"human-input-{self.player_id}",
+            )
+            # Drop queued prompts at exit (e.g. after Ctrl-C) instead of running them
+            atexit.register(self._io_executor.shutdown, wait=False, cancel_futures=True)
+        return self._io_executor
+
+    async def _read_stdin_line(self, prompt: str) -> str:
+        """Read one line from stdin without a thread"""
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+
+        line = await self._wait_stdin_line()
+        return line.decode(sys.stdin.encoding or "utf-8", errors="replace")
+
+    async def _wait_stdin_line(self) -> bytes:
+        """
+        Read stdin up to and including the next newline, one byte per wakeup.
+
+        Nothing past the newline is consumed, so typed-ahead input stays in
+        the terminal for the plain input() calls elsewhere in the game. Uses
+        add_reader rather than connect_read_pipe so stdin stays in blocking
+        mode for those calls.
+        """
+        loop = asyncio.get_running_loop()
+        fd = sys.stdin.fileno()
+        future: asyncio.Future[bytes] = loop.create_future()
+        line = bytearray()
+
+        def on_readable() -> None:
+            if future.done():
+                return
+            try:
+                byte = os.read(fd, 1)
+            except OSError as e:
+                future.set_exception(e)
+                return
+            if not byte:
+                future.set_exception(EOFError("stdin closed"))
+            elif byte == b"\n":
+                future.set_result(bytes(line))
+            else:
+                line.extend(byte)
+
+        loop.add_reader(fd, on_readable)
+        try:
+            return await future
+        finally:
+            loop.remove_reader(fd)
+
+    async def aclose(self) -> None:
+        """Shut down the input thread"""
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=False, cancel_futures=True)
+            atexit.unregister(self._io_executor.shutdown)
+            self._io_executor = None
 
     async def decide_action(self, state: GameState) -> Union[DeckAction, DiceAction]:
         """Get action from human via terminal"""
@@ -51,7 +170,7 @@ class HumanPlayer(BaseAgent):
         print("=" * 40)
 
         # Show hand
-        hand_str = " ".join(f"[{i+1}:{c.value}]" for i, c in enumerate(self.player.hand))
+        hand_str = " ".join([f"[{i+1}:{_CARD_STR[c]}]" for i, c in enumerate(self.player.hand)])
         print(f"\nYour hand: {hand_str}")
         print(f"Target card this round: {state.current_round_claim.value if state.current_round_claim else 'Any'}")
         print(f"Cards on table: {state.cards_on_table}")
@@ -67,13 +186,13 @@ class HumanPlayer(BaseAgent):
                     print("You must play at least 1 card.")
                     continue
 
-                # Parse card indices
-                indices = [int(x) - 1 for x in cards_input.split()]
-
-                if not indices:
-                    print("You must play at least 1 card.")
+                # Validate the format up front so int() can't fail
+                if not _CARDS_INPUT_RE.fullmatch(cards_input):
+                    print("Invalid input. Please enter card numbers separated by spaces.")
                     continue
 
+                indices = [int(x) - 1 for x in cards_input.split()]
+
                 if len(indices) > 3:
                     print("You can only play up to 3 cards.")
                     continue
@@ -99,21 +218,16 @@ class HumanPlayer(BaseAgent):
                 if not claim_input:
                     claim = state.current_round_claim or CardType.KING
                 else:
-                    claim_upper = claim_input.upper()
-                    if claim_upper in ["Q", "QUEEN"]:
-                        claim = CardType.QUEEN
-                    elif claim_upper in ["K", "KING"]:
-                        claim = CardType.KING
-                    elif claim_upper in ["A", "ACE"]:
-                        claim = CardType.ACE
-                    else:
+                    claim = _CLAIM_MAP.get(claim_input.upper())
+                    if claim is None:
                         print("Invalid claim. Use Q, K, or A.")
                         continue
 
+                action = DeckAction.create(self.player_id, cards, claim)
+
                 # Show what they're doing
-                cards_str = ", ".join(c.value for c in cards)
-                is_truth = all(c == claim or c == CardType.JOKER for c in cards)
-                truth_str = "(TRUTH)" if is_truth else "(BLUFF!)"
+                cards_str = ", ".join([_CARD_STR[c] for c in cards])
+                truth_str = "(TRUTH)" if action.is_truth else "(BLUFF!)"
 
                 print(f"\nYou play {len(cards)} card(s): {cards_str}")
                 print(f"You claim they are all: {claim.value} {truth_str}")
@@ -122,10 +236,8 @@ class HumanPlayer(BaseAgent):
                 if confirm.lower() not in ["", "y", "yes"]:
                     continue
 
-                return DeckAction.create(self.player_id, cards, claim)
+                return action
 
-            except ValueError:
-                print("Invalid input. Please enter card numbers separated by spaces.")
             except Exception as e:
                 print(f"Error: {e}. Please try again.")
 
@@ -136,7 +248,6 @@ class HumanPlayer(BaseAgent):
         print("=" * 40)
 
         # Show dice
-        from game.dice_mode import LiarsDice
         dice_str = LiarsDice.format_dice(self.player.dice)
         print(f"\nYour dice: {dice_str}")
         print(f"Your dice values: {self.player.dice}")
@@ -204,9 +315,9 @@ class HumanPlayer(BaseAgent):
 
         # Show roulette danger
         shots = state.roulette.shots_fired if state.roulette else 0
-        death_prob = (shots + 1) / 6 * 100
+        death_prob = ROULETTE_DEATH_PROB_LABELS[min(shots, len(ROULETTE_DEATH_PROB_LABELS) - 1)]
         print(f"\nRoulette danger: {shots}/6 chambers fired")
-        print(f"If you lose, death probability: {death_prob:.0f}%")
+        print(f"If you lose, death probability: {death_prob}")
 
         while True:
             response = await self._get_input("\nChallenge? Call LIAR! (y/n): ")
@@ -223,28 +334,31 @@ class HumanPlayer(BaseAgent):
 
     async def on_game_start(self, state: GameState) -> None:
         """Show game start message"""
-        print("\n" + "=" * 50)
-        print("   WELCOME TO LIAR'S BAR!")
-        print("=" * 50)
         mode = "LIAR'S DECK" if state.mode == GameMode.LIARS_DECK else "LIAR'S DICE"
-        print(f"\nGame mode: {mode}")
-        print(f"You are playing as: {self.name}")
-        print("\nOther players:")
+        lines = [
+            "",
+            _BAR50,
+            "   WELCOME TO LIAR'S BAR!",
+            _BAR50,
+            f"\nGame mode: {mode}",
+            f"You are playing as: {self.name}",
+            "\nOther players:",
+        ]
         for p in state.players:
             if p.id != self.player_id:
                 model = f" ({p.model_id})" if p.model_id else ""
-                print(f"  - {p.name}{model}")
-        print()
+                lines.append(f"  - {p.name}{model}")
+        lines.append("")
+        _write_lines(lines)
 
     async def on_round_start(self, state: GameState) -> None:
         """Show round start message"""
-        print("\n" + "=" * 50)
-        print(f"   ROUND {state.round_number}")
-        print("=" * 50)
+        lines = ["", _BAR50, f"   ROUND {state.round_number}", _BAR50]
 
         if state.mode == GameMode.LIARS_DECK:
-            print(f"Target card: {state.current_round_claim.value if state.current_round_claim else 'TBD'}")
-        print()
+            lines.append(f"Target card: {state.current_round_claim.value if state.current_round_claim else 'TBD'}")
+        lines.append("")
+        _write_lines(lines)
 
     async def on_challenge(
         self,
@@ -260,24 +374,17 @@ class HumanPlayer(BaseAgent):
         challenged = state.get_player_by_id(challenged_id)
         loser = state.get_player_by_id(loser_id)
 
-        print("\n" + "!" * 50)
-        print("   CHALLENGE!")
-        print("!" * 50)
-        print(f"\n{challenger.name if challenger else challenger_id} challenges {challenged.name if challenged else challenged_id}!")
-
-        if was_bluff:
-            print("REVEAL: It WAS a bluff!")
-        else:
-            print("REVEAL: It was TRUTH!")
-
-        print(f"\n{loser.name if loser else loser_id} must play Russian Roulette...")
-
-        if survived:
-            print("*CLICK* ... Empty chamber! SURVIVED!")
-        else:
-            print("*BANG* ... ELIMINATED!")
-
-        print("!" * 50)
+        _write_lines([
+            "",
+            _BANG50,
+            "   CHALLENGE!",
+            _BANG50,
+            f"\n{challenger.name if challenger else challenger_id} challenges {challenged.name if challenged else challenged_id}!",
+            "REVEAL: It WAS a bluff!" if was_bluff else "REVEAL: It was TRUTH!",
+            f"\n{loser.name if loser else loser_id} must play Russian Roulette...",
+            "*CLICK* ... Empty chamber! SURVIVED!" if survived else "*BANG* ... ELIMINATED!",
+            _BANG50,
+        ])
 
     async def on_elimination(
         self,
@@ -288,28 +395,25 @@ class HumanPlayer(BaseAgent):
         """Show elimination message"""
         eliminated = state.get_player_by_id(eliminated_id)
         if eliminated_id == self.player_id:
-            print("\n" + "X" * 50)
-            print("   YOU HAVE BEEN ELIMINATED!")
-            print("X" * 50)
+            _write_lines(["", _X50, "   YOU HAVE BEEN ELIMINATED!", _X50])
         else:
-            print(f"\n{eliminated.name if eliminated else eliminated_id} has been eliminated!")
+            _write_lines([f"\n{eliminated.name if eliminated else eliminated_id} has been eliminated!"])
 
     async def on_game_over(self, winner_id: str, state: GameState) -> None:
         """Show game over message"""
         winner = state.get_player_by_id(winner_id)
 
-        print("\n" + "=" * 50)
-        print("   GAME OVER!")
-        print("=" * 50)
+        lines = ["", _BAR50, "   GAME OVER!", _BAR50]
 
         if winner_id == self.player_id:
-            print("\n   CONGRATULATIONS! YOU WIN!")
+            lines.append("\n   CONGRATULATIONS! YOU WIN!")
         else:
-            print(f"\n   Winner: {winner.name if winner else winner_id}")
+            lines.append(f"\n   Winner: {winner.name if winner else winner_id}")
 
-        print("\nFinal standings:")
+        lines.append("\nFinal standings:")
         for i, p in enumerate(state.players):
             status = "WINNER" if p.id == winner_id else "Eliminated"
-            print(f"  {i+1}. {p.name} - {status}")
+            lines.append(f"  {i+1}. {p.name} - {status}")
 
-        print("=" * 50)
+        lines.append(_BAR50)
+        _write_lines(lines)
@@ -4,12 +4,14 @@ AI Agent Personalities
 Configuration for different AI agent personalities and their LLM models.
 """
 
-from typing import TypedDict
+from functools import lru_cache
+from typing import NotRequired, TypedDict
 
 
 class AgentConfig(TypedDict):
     """Configuration for an AI agent"""
     model_id: str           # OpenRouter model ID
+    challenge_model_id: NotRequired[str]  # Cheaper model for challenge decisions
     name: str               # Display name
     character: str          # Character name from the game
     personality: str        # Personality description for system prompt
@@ -18,9 +20,11 @@ class AgentConfig(TypedDict):
 
 
 # AI Agent configurations with different personalities
+# Treated as read-only: get_system_prompt caches prompts built from it
 AGENT_CONFIGS: dict[str, AgentConfig] = {
     "claude": {
         "model_id": "anthropic/claude-3.5-sonnet",
+        "challenge_model_id": "anthropic/claude-3.5-haiku",
         "name": "Claude",
         "character": "Foxy",  # The cunning fox
         "personality": """You are Claude, playing as Foxy the Fox in Liar's Bar.
@@ -44,6 +48,7 @@ PLAY STYLE:
     },
     "gpt": {
         "model_id": "openai/gpt-4o",
+        "challenge_model_id": "openai/gpt-4o-mini",
         "name": "GPT",
         "character": "Bristle",  # The intimidating pig
         "personality": """You are GPT, playing as Bristle the Pig in Liar's Bar.
@@ -67,6 +72,7 @@ PLAY STYLE:
     },
     "llama": {
         "model_id": "meta-llama/llama-3.1-70b-instruct",
+        "challenge_model_id": "meta-llama/llama-3.1-8b-instruct",
         "name": "Llama",
         "character": "Scub",  # The deceptively simple bulldog
         "personality": """You are Llama, playing as Scub the Bulldog in Liar's Bar.
@@ -102,6 +108,7 @@ def get_all_agent_keys() -> list[str]:
     return list(AGENT_CONFIGS.keys())
 
 
+@lru_cache(maxsize=32)
 def get_system_prompt(agent_key: str, include_rules: bool = True) -> str:
     """
     Generate a complete system prompt for an AI agent.
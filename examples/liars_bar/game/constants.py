@@ -14,7 +14,12 @@ class GameMode(str, Enum):
 
 
 class CardType(str, Enum):
-    """Card types in Liar's Deck mode"""
+    """
+    Card types in Liar's Deck mode.
+
+    Members are singletons (pydantic validation and deepcopy return the
+    same objects), so card checks compare with ``is`` rather than str ``==``.
+    """
     QUEEN = "Q"
     KING = "K"
     ACE = "A"
@@ -39,6 +44,18 @@ DECK_MIN_CARDS_PER_PLAY = 1
 DECK_MAX_CARDS_PER_PLAY = 3
 DECK_CLAIMABLE_TYPES = [CardType.QUEEN, CardType.KING, CardType.ACE]
 
+# Accepted (upper-case) spellings for each card type
+CARD_ALIASES = {
+    "Q": CardType.QUEEN,
+    "QUEEN": CardType.QUEEN,
+    "K": CardType.KING,
+    "KING": CardType.KING,
+    "A": CardType.ACE,
+    "ACE": CardType.ACE,
+    "J": CardType.JOKER,
+    "JOKER": CardType.JOKER,
+}
+
 # Liar's Dice configuration
 DICE_PER_PLAYER = 5
 DICE_FACES = 6  # Standard dice: 1-6
@@ -49,6 +66,13 @@ DICE_MAX_FACE = 6
 ROULETTE_CHAMBERS = 6
 ROULETTE_BULLETS = 1
 
+# Death chance of the next pull as display text, indexed by shots already fired.
+# The bullet is in one of the chambers not yet fired, as in RussianRoulette.
+ROULETTE_DEATH_PROB_LABELS = tuple(
+    f"{1 / (ROULETTE_CHAMBERS - shots) * 100:.0f}%"
+    for shots in range(ROULETTE_CHAMBERS)
+)
+
 # Game configuration
 MIN_PLAYERS = 2
 MAX_PLAYERS = 4
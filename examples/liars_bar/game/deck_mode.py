@@ -6,6 +6,8 @@ Players must claim their cards match the round's target type.
 """
 
 import random
+from collections import Counter
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from .constants import (
@@ -16,11 +18,18 @@ from .constants import (
     DECK_MAX_CARDS_PER_PLAY,
     DECK_CLAIMABLE_TYPES,
 )
-from .models import Player, DeckAction
+from .models import Player, DeckAction, _play_is_truth
 
 if TYPE_CHECKING:
     from .models import GameState
 
+# Unshuffled deck, built once from the card distribution
+_BASE_DECK: tuple[CardType, ...] = tuple(
+    card_type
+    for card_type, count in DECK_CARD_DISTRIBUTION.items()
+    for _ in range(count)
+)
+
 
 class LiarsDeck:
     """
@@ -35,39 +44,39 @@ class LiarsDeck:
     - If challenged: reveal cards, loser plays roulette
     """
 
-    def __init__(self):
+    def __init__(self, rng: random.Random | None = None):
+        # Own RNG so seeded or parallel games don't share the global one
+        self._rng = rng or random.Random()
         self.deck: list[CardType] = []
         self.round_target: CardType | None = None
-        self.cards_on_table: list[list[CardType]] = []  # All cards played this round
+        self.cards_on_table: list[tuple[CardType, ...]] = []  # All cards played this round
 
     def create_deck(self) -> list[CardType]:
         """Create and shuffle a new deck"""
-        deck = []
-        for card_type, count in DECK_CARD_DISTRIBUTION.items():
-            deck.extend([card_type] * count)
-        random.shuffle(deck)
+        deck = list(_BASE_DECK)
+        self._rng.shuffle(deck)
         self.deck = deck
         return deck
 
     def deal_cards(self, players: list[Player]) -> None:
-        """Deal cards to all players"""
+        """Deal cards to the given (active) players"""
         if not self.deck:
             self.create_deck()
 
+        deck = self.deck
         for player in players:
-            if player.is_alive():
-                player.hand = []
-                for _ in range(DECK_CARDS_PER_PLAYER):
-                    if self.deck:
-                        player.hand.append(self.deck.pop())
+            # Deal from the top (end) of the deck, top card first
+            hand = deck[:-DECK_CARDS_PER_PLAYER - 1:-1]
+            del deck[-DECK_CARDS_PER_PLAYER:]
+            player.hand = hand
 
     def start_round(self) -> CardType:
         """Start a new round - randomly select target card type"""
-        self.round_target = random.choice(DECK_CLAIMABLE_TYPES)
+        self.round_target = self._rng.choice(DECK_CLAIMABLE_TYPES)
         self.cards_on_table = []
         return self.round_target
 
-    def validate_play(self, player: Player, cards: list[CardType]) -> tuple[bool, str]:
+    def validate_play(self, player: Player, cards: Sequence[CardType]) -> tuple[bool, str]:
         """
         Validate if a play is legal.
 
@@ -81,44 +90,42 @@ class LiarsDeck:
         if len(cards) > DECK_MAX_CARDS_PER_PLAY:
             return False, f"Cannot play more than {DECK_MAX_CARDS_PER_PLAY} cards"
 
-        # Check if player has these cards
-        hand_copy = player.hand.copy()
-        for card in cards:
-            if card not in hand_copy:
-                return False, f"You don't have {card.value} in your hand"
-            hand_copy.remove(card)
+        # Check if player has these cards: anything left after taking away
+        # the hand's counts is a card type they ran short of
+        missing = Counter(cards) - Counter(player.hand)
+        if missing:
+            card = next(c for c in cards if c in missing)
+            return False, f"You don't have {card.value} in your hand"
 
         return True, ""
 
     def play_cards(self, player: Player, action: DeckAction) -> None:
         """Execute a card play action"""
-        # Remove cards from player's hand
-        for card in action.cards_played:
-            if card in player.hand:
-                player.hand.remove(card)
+        # Remove the first occurrence of each played card in a single pass
+        to_remove = Counter(action.cards_played)
+        remaining = []
+        for card in player.hand:
+            if to_remove[card] > 0:
+                to_remove[card] -= 1
+            else:
+                remaining.append(card)
+        player.hand = remaining
 
         # Add to table
         self.cards_on_table.append(action.cards_played)
 
-    def reveal_last_play(self, action: DeckAction) -> tuple[bool, list[CardType]]:
+    def reveal_last_play(self, action: DeckAction) -> tuple[bool, tuple[CardType, ...]]:
         """
         Reveal the last play to check if it was a bluff.
 
         Returns:
-            tuple[bool, list[CardType]]: (was_truthful, actual_cards)
+            tuple[bool, tuple[CardType, ...]]: (was_truthful, actual_cards)
         """
         return action.is_truth, action.cards_played
 
     def check_round_end(self, players: list[Player]) -> bool:
-        """Check if the round should end (all cards played or only one player left)"""
-        active_players = [p for p in players if p.is_alive()]
-
-        # Check if any active player still has cards
-        for player in active_players:
-            if player.hand:
-                return False
-
-        return True
+        """Check if the round should end (no active player has cards left)"""
+        return not any(player.hand for player in players)
 
     def get_round_target(self) -> CardType | None:
         """Get the current round's target card type"""
@@ -141,6 +148,6 @@ class LiarsDeck:
         return " ".join(f"[{card.value}]" for card in hand)
 
     @staticmethod
-    def is_valid_claim(cards: list[CardType], claim: CardType) -> bool:
-        """Check if a claim is actually truthful"""
-        return all(card == claim or card == CardType.JOKER for card in cards)
+    def is_valid_claim(cards: Sequence[CardType], claim: CardType) -> bool:
+        """Check if a claim is actually truthful (same rule as DeckAction.is_truth)"""
+        return _play_is_truth(tuple(cards), claim)
@@ -18,6 +18,12 @@ from .models import Player, DiceAction
 if TYPE_CHECKING:
     from .models import GameState
 
+# All die faces, for drawing rolls in bulk
+_DICE_FACES: tuple[int, ...] = tuple(range(DICE_MIN_FACE, DICE_MAX_FACE + 1))
+
+# Unicode glyph per face, indexed by face value (index 0 unused)
+_DICE_GLYPHS: tuple[str, ...] = ("?", "⚀", "⚁", "⚂", "⚃", "⚄", "⚅")
+
 
 class LiarsDice:
     """
@@ -33,17 +39,33 @@ class LiarsDice:
     - If actual count < bid: bidder loses
     """
 
-    def __init__(self):
+    def __init__(self, rng: random.Random | None = None):
+        # Own RNG so seeded or parallel games don't share the global one
+        self._rng = rng or random.Random()
         self.current_bid: DiceAction | None = None
 
+        # Per-face dice totals for the players counted at roll time
+        self._face_counts: list[int] = [0] * (DICE_MAX_FACE + 1)
+        self._counted_ids: tuple[str, ...] = ()
+
     def roll_dice(self, players: list[Player]) -> None:
-        """Roll dice for all active players"""
-        for player in players:
-            if player.is_alive():
-                player.dice = [
-                    random.randint(DICE_MIN_FACE, DICE_MAX_FACE)
-                    for _ in range(DICE_PER_PLAYER)
-                ]
+        """Roll dice for the given (active) players"""
+        # One RNG call for every die on the table, then split per player
+        rolls = self._rng.choices(_DICE_FACES, k=len(players) * DICE_PER_PLAYER)
+        for i, player in enumerate(players):
+            start = i * DICE_PER_PLAYER
+            player.dice = rolls[start:start + DICE_PER_PLAYER]
+
+        self._build_face_counts(players)
+
+    def _build_face_counts(self, alive: list[Player]) -> None:
+        """Rebuild the dice-face histogram for the given alive players"""
+        counts = [0] * (DICE_MAX_FACE + 1)
+        for player in alive:
+            for d in player.dice:
+                counts[d] += 1
+        self._face_counts = counts
+        self._counted_ids = tuple(p.id for p in alive)
 
     def validate_bid(self, new_bid: DiceAction) -> tuple[bool, str]:
         """
@@ -75,12 +97,14 @@ class LiarsDice:
         self.current_bid = action
 
     def count_face(self, players: list[Player], face: int) -> int:
-        """Count how many dice show a specific face across all active players"""
-        total = 0
-        for player in players:
-            if player.is_alive():
-                total += sum(1 for d in player.dice if d == face)
-        return total
+        """Count how many dice show a specific face across the given (active) players"""
+        # Recount only if the set of players changed since the roll
+        if tuple(p.id for p in players) != self._counted_ids:
+            self._build_face_counts(players)
+
+        if not (DICE_MIN_FACE <= face <= DICE_MAX_FACE):
+            return 0
+        return self._face_counts[face]
 
     def resolve_challenge(
         self, players: list[Player]
@@ -111,26 +135,23 @@ class LiarsDice:
         return self.current_bid
 
     def get_all_dice(self, players: list[Player]) -> dict[str, list[int]]:
-        """Get all dice from all active players (for reveal)"""
-        return {
-            player.id: player.dice.copy()
-            for player in players
-            if player.is_alive()
-        }
+        """Get all dice from the given (active) players (for reveal)"""
+        return {player.id: player.dice.copy() for player in players}
 
     def get_max_possible_count(self, players: list[Player]) -> int:
-        """Get maximum possible count of any face (all dice from active players)"""
-        return sum(
-            DICE_PER_PLAYER
-            for player in players
-            if player.is_alive()
-        )
+        """Get maximum possible count of any face (all dice from the given active players)"""
+        return len(players) * DICE_PER_PLAYER
 
     @staticmethod
     def format_dice(dice: list[int]) -> str:
         """Format dice for display"""
-        dice_faces = {1: "⚀", 2: "⚁", 3: "⚂", 4: "⚃", 5: "⚄", 6: "⚅"}
-        return " ".join(dice_faces.get(d, str(d)) for d in dice)
+        glyphs = _DICE_GLYPHS
+        if all(DICE_MIN_FACE <= d <= DICE_MAX_FACE for d in dice):
+            return " ".join([glyphs[d] for d in dice])
+        return " ".join(
+            glyphs[d] if DICE_MIN_FACE <= d <= DICE_MAX_FACE else str(d)
+            for d in dice
+        )
 
     @staticmethod
     def format_bid(bid: DiceAction | None) -> str:
@@ -4,6 +4,8 @@ Game Engine
 Main game orchestrator that coordinates game flow, turns, and state management.
 """
 
+import asyncio
+import random
 from typing import Union, Callable, Awaitable, TYPE_CHECKING
 
 from .constants import GameMode, PlayerStatus
@@ -41,9 +43,12 @@ class GameEngine:
     - Win condition checking
     """
 
-    def __init__(self, mode: GameMode, players: list[Player]):
+    def __init__(self, mode: GameMode, players: list[Player], seed: int | None = None):
+        # One RNG shared by every random mechanic, so a seed replays the game
+        self._rng = random.Random(seed)
+
         self.state = GameState(mode=mode, players=players)
-        self.roulette = RussianRoulette()
+        self.roulette = RussianRoulette(self._rng)
         self.state.roulette = self.roulette.get_state()
 
         # Mode-specific handlers
@@ -51,9 +56,9 @@ class GameEngine:
         self.dice_game: LiarsDice | None = None
 
         if mode == GameMode.LIARS_DECK:
-            self.deck_game = LiarsDeck()
+            self.deck_game = LiarsDeck(self._rng)
         else:
-            self.dice_game = LiarsDice()
+            self.dice_game = LiarsDice(self._rng)
 
         # Event callbacks
         self._event_callbacks: list[EventCallback] = []
@@ -64,8 +69,17 @@ class GameEngine:
 
     async def _emit_event(self, event: GameEvent) -> None:
         """Emit a game event to all registered callbacks"""
-        for callback in self._event_callbacks:
-            await callback(event)
+        if not self._event_callbacks:
+            return
+
+        # Run subscribers concurrently; one failing callback doesn't stop the rest
+        results = await asyncio.gather(
+            *(callback(event) for callback in self._event_callbacks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"[Engine] Event callback failed: {result}")
 
     def setup_round(self) -> None:
         """Set up a new round"""
@@ -110,28 +124,26 @@ class GameEngine:
 
     def advance_turn(self) -> Player:
         """Advance to the next active player"""
-        active_players = self.state.get_active_players()
-        if len(active_players) <= 1:
-            return active_players[0] if active_players else self.state.players[0]
-
-        # Find current player in active list
-        current = self.get_current_player()
-        current_active_idx = next(
-            (i for i, p in enumerate(active_players) if p.id == current.id),
-            0
-        )
-
-        # Move to next active player
-        next_active_idx = (current_active_idx + 1) % len(active_players)
-        next_player = active_players[next_active_idx]
+        state = self.state
+        players = state.players
+        n = len(players)
+
+        # Walk forward from the current seat, skipping eliminated players
+        i = state.current_player_idx
+        for _ in range(n):
+            i = i + 1 if i + 1 < n else 0
+            if players[i].is_alive():
+                break
+        else:
+            return players[0]
 
-        # Update state to point to this player in the full list
-        self.state.current_player_idx = next(
-            i for i, p in enumerate(self.state.players) if p.id == next_player.id
-        )
+        if i == state.current_player_idx:
+            # Only one player left - nothing to advance to
+            return players[i]
 
-        self.state.turn_number += 1
-        return next_player
+        state.current_player_idx = i
+        state.turn_number += 1
+        return players[i]
 
     def process_deck_action(self, action: DeckAction) -> bool:
         """
@@ -187,6 +199,9 @@ class GameEngine:
 
         Returns the result including roulette outcome.
         """
+        state = self.state
+        roulette = self.roulette
+
         # Determine if the challenged player was bluffing
         was_bluff = self._check_bluff()
 
@@ -197,22 +212,20 @@ class GameEngine:
             loser = challenger
 
         # Execute Russian roulette
-        survived, chamber = self.roulette.pull_trigger()
+        survived, chamber = roulette.pull_trigger()
 
         if not survived:
             # Player eliminated
-            loser_obj = self.state.get_player_by_id(loser.id)
-            if loser_obj:
-                loser_obj.status = PlayerStatus.ELIMINATED
-            self.roulette.reset()
+            self._eliminate(loser.id)
+            roulette.reset()
         else:
             # Player survived
-            loser_obj = self.state.get_player_by_id(loser.id)
+            loser_obj = state.get_player_by_id(loser.id)
             if loser_obj:
                 loser_obj.bullets_survived += 1
 
         # Update roulette state
-        self.state.roulette = self.roulette.get_state()
+        state.roulette = roulette.get_state()
 
         result = ChallengeResult(
             challenger_id=challenger.id,
@@ -223,37 +236,44 @@ class GameEngine:
             chamber_number=chamber
         )
 
-        self.state.challenge_history.append(result)
-
-        # Emit event
-        await self._emit_event(GameEvent(
-            event_type="challenge",
-            player_id=challenger.id,
-            details={
-                "challenged": challenged.id,
-                "was_bluff": was_bluff,
-                "loser": loser.id,
-                "survived": survived,
-                "chamber": chamber
-            }
-        ))
+        state.challenge_history.append(result)
+
+        # Emit event (skip building it when nobody is listening)
+        if self._event_callbacks:
+            await self._emit_event(GameEvent(
+                event_type="challenge",
+                player_id=challenger.id,
+                details={
+                    "challenged": challenged.id,
+                    "was_bluff": was_bluff,
+                    "loser": loser.id,
+                    "survived": survived,
+                    "chamber": chamber
+                }
+            ))
 
         return result
 
+    def _eliminate(self, player_id: str) -> None:
+        """Mark a player eliminated and drop the cached active-player list"""
+        player = self.state.get_player_by_id(player_id)
+        if player:
+            player.status = PlayerStatus.ELIMINATED
+            self.state.invalidate_active_players()
+
     def _check_bluff(self) -> bool:
         """Check if the last action was a bluff"""
-        if self.state.mode == GameMode.LIARS_DECK:
-            last_action = self.state.deck_actions[-1] if self.state.deck_actions else None
-            if isinstance(last_action, DeckAction):
-                return not last_action.is_truth
-        else:
-            if self.dice_game is None:
-                return False
-            active_players = self.state.get_active_players()
-            was_bluff, _, _ = self.dice_game.resolve_challenge(active_players)
-            return was_bluff
-
-        return False
+        state = self.state
+        if state.mode == GameMode.LIARS_DECK:
+            # deck_actions only ever holds DeckAction entries
+            deck_actions = state.deck_actions
+            return not deck_actions[-1].is_truth if deck_actions else False
+
+        dice_game = self.dice_game
+        if dice_game is None:
+            return False
+        was_bluff, _, _ = dice_game.resolve_challenge(state.get_active_players())
+        return was_bluff
 
     def check_game_over(self) -> bool:
         """Check if the game is over (only one player remaining)"""
@@ -293,9 +313,20 @@ class GameEngine:
         # Can challenge if there's a previous action
         return self.get_last_action() is not None
 
+    def get_game_state_readonly(self) -> GameState:
+        """
+        Get the live game state without copying.
+
+        Callers must not mutate it; use get_game_state() for an isolated copy.
+        """
+        return self.state
+
     def get_game_state(self) -> GameState:
         """Get a copy of the current game state"""
-        return self.state.model_copy(deep=True)
+        state = self.state.model_copy(deep=True)
+        # Private attrs are copied apart from the players, so drop the stale cache
+        state.invalidate_active_players()
+        return state
 
     def get_winner(self) -> Player | None:
         """Get the winner if game is over"""
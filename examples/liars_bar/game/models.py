@@ -4,11 +4,19 @@ Liar's Bar Game Models
 Pydantic models for game state, players, and actions.
 """
 
+from collections.abc import Sequence
 from datetime import datetime
+from itertools import product
 from typing import Literal, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
-from .constants import GameMode, CardType, PlayerStatus
+from .constants import (
+    GameMode,
+    CardType,
+    PlayerStatus,
+    DECK_MIN_CARDS_PER_PLAY,
+    DECK_MAX_CARDS_PER_PLAY,
+)
 
 
 class Player(BaseModel):
@@ -26,25 +34,43 @@ class Player(BaseModel):
         return self.status == PlayerStatus.ALIVE
 
 
+def _play_is_truth(cards: tuple[CardType, ...], claim: CardType) -> bool:
+    """Truthful when every card is the claimed type or a joker"""
+    return set(cards) <= {claim, CardType.JOKER}
+
+
+# Truth of every legal play against every claim (a few hundred entries)
+_TRUTH_TABLE: dict[tuple[tuple[CardType, ...], CardType], bool] = {
+    (cards, claim): _play_is_truth(cards, claim)
+    for n in range(DECK_MIN_CARDS_PER_PLAY, DECK_MAX_CARDS_PER_PLAY + 1)
+    for cards in product(CardType, repeat=n)
+    for claim in CardType
+}
+
+
 class DeckAction(BaseModel):
     """Action in Liar's Deck mode - playing cards"""
+    # Frozen so is_truth can't drift from the cards after creation
+    model_config = ConfigDict(frozen=True)
+
     player_id: str
-    cards_played: list[CardType]  # Actual cards played (hidden from others)
+    cards_played: tuple[CardType, ...]  # Actual cards played (hidden from others)
     cards_count: int  # Number of cards played (visible)
     claimed_type: CardType  # What the player claims the cards are
     is_truth: bool  # Whether the claim is actually true
     timestamp: datetime = Field(default_factory=datetime.now)
 
     @classmethod
-    def create(cls, player_id: str, cards: list[CardType], claim: CardType) -> "DeckAction":
+    def create(cls, player_id: str, cards: Sequence[CardType], claim: CardType) -> "DeckAction":
         """Create a deck action and automatically determine if it's truth"""
-        is_truth = all(
-            card == claim or card == CardType.JOKER
-            for card in cards
-        )
+        key = (tuple(cards), claim)
+        is_truth = _TRUTH_TABLE.get(key)
+        if is_truth is None:
+            # Illegal play sizes aren't tabled; validation rejects them later
+            is_truth = _play_is_truth(*key)
         return cls(
             player_id=player_id,
-            cards_played=cards,
+            cards_played=key[0],
             cards_count=len(cards),
             claimed_type=claim,
             is_truth=is_truth
@@ -60,14 +86,8 @@ class DiceAction(BaseModel):
 
     def is_higher_than(self, other: "DiceAction | None") -> bool:
         """Check if this bid is higher than another bid"""
-        if other is None:
-            return True
         # Higher count wins, or same count with higher face
-        if self.bid_count > other.bid_count:
-            return True
-        if self.bid_count == other.bid_count and self.bid_face > other.bid_face:
-            return True
-        return False
+        return other is None or (self.bid_count, self.bid_face) > (other.bid_count, other.bid_face)
 
 
 class ChallengeResult(BaseModel):
@@ -82,6 +102,9 @@ class ChallengeResult(BaseModel):
 
 class RouletteState(BaseModel):
     """State of the Russian roulette revolver"""
+    # Frozen so the same snapshot can be shared without copying
+    model_config = ConfigDict(frozen=True)
+
     chambers: int = 6
     bullet_position: int  # 0-5, which chamber has the bullet
     current_chamber: int = 0  # Current chamber position
@@ -115,20 +138,39 @@ class GameState(BaseModel):
     game_over: bool = False
     winner_id: str | None = None
 
+    # Alive players, rebuilt lazily after an elimination
+    _active_players: list[Player] | None = PrivateAttr(default=None)
+    # Player id -> position in players (indices stay valid across deep copies)
+    _player_index: dict[str, int] = PrivateAttr(default_factory=dict)
+
     def get_active_players(self) -> list[Player]:
-        """Return list of players still in the game"""
-        return [p for p in self.players if p.is_alive()]
+        """Return list of players still in the game (shared, don't mutate)"""
+        if self._active_players is None:
+            self._active_players = [p for p in self.players if p.is_alive()]
+        return self._active_players
+
+    def invalidate_active_players(self) -> None:
+        """Drop the cached active list after a player's status changes"""
+        self._active_players = None
 
     def get_current_player(self) -> Player:
         """Get the current player"""
         return self.players[self.current_player_idx]
 
+    def get_player_index(self, player_id: str) -> int | None:
+        """Find a player's position in the players list"""
+        idx = self._player_index.get(player_id)
+        players = self.players
+        if idx is None or idx >= len(players) or players[idx].id != player_id:
+            # Players list changed since the index was built
+            self._player_index = {p.id: i for i, p in enumerate(players)}
+            idx = self._player_index.get(player_id)
+        return idx
+
     def get_player_by_id(self, player_id: str) -> Player | None:
         """Find a player by ID"""
-        for player in self.players:
-            if player.id == player_id:
-                return player
-        return None
+        idx = self.get_player_index(player_id)
+        return None if idx is None else self.players[idx]
 
     def get_last_action(self) -> Union[DeckAction, DiceAction, None]:
         """Get the last action taken"""
@@ -10,6 +10,28 @@ from .constants import ROULETTE_CHAMBERS, ROULETTE_BULLETS
 from .models import RouletteState
 
 
+def _survival_probability(chambers: int, shots_fired: int) -> float:
+    """Chance the next pull is empty after shots_fired empty chambers"""
+    # One of the remaining chambers has the bullet
+    remaining_chambers = chambers - shots_fired
+    if remaining_chambers <= 0:
+        # This shouldn't happen in normal play
+        return 0.0
+    return (remaining_chambers - 1) / remaining_chambers
+
+
+def death_probability(chambers: int, shots_fired: int) -> float:
+    """Chance the next pull fires the bullet after shots_fired empty chambers"""
+    return 1.0 - _survival_probability(chambers, shots_fired)
+
+
+# Survival odds for the standard revolver, indexed by shots fired
+_SURVIVAL_LUT: tuple[float, ...] = tuple(
+    _survival_probability(ROULETTE_CHAMBERS, shots)
+    for shots in range(ROULETTE_CHAMBERS)
+)
+
+
 class RussianRoulette:
     """
     Russian Roulette implementation.
@@ -20,14 +42,15 @@ class RussianRoulette:
     - Resets after someone is eliminated
     """
 
-    def __init__(self):
+    def __init__(self, rng: random.Random | None = None):
+        self._rng = rng or random.Random()
         self.state = self._create_fresh_state()
 
     def _create_fresh_state(self) -> RouletteState:
         """Create a new roulette state with random bullet position"""
         return RouletteState(
             chambers=ROULETTE_CHAMBERS,
-            bullet_position=random.randint(0, ROULETTE_CHAMBERS - 1),
+            bullet_position=self._rng.randint(0, ROULETTE_CHAMBERS - 1),
             current_chamber=0,
             shots_fired=0
         )
@@ -45,12 +68,16 @@ class RussianRoulette:
                 - survived: True if empty chamber, False if bullet
                 - chamber_number: Which chamber was fired (1-6 for display)
         """
-        chamber = self.state.current_chamber
-        survived = chamber != self.state.bullet_position
+        state = self.state
+        chamber = state.current_chamber
+        survived = chamber != state.bullet_position
 
-        # Advance to next chamber
-        self.state.current_chamber = (self.state.current_chamber + 1) % self.state.chambers
-        self.state.shots_fired += 1
+        # Advance to next chamber, wrapping with a compare rather than a modulo
+        next_chamber = chamber + 1
+        self.state = state.model_copy(update={
+            "current_chamber": next_chamber if next_chamber < state.chambers else 0,
+            "shots_fired": state.shots_fired + 1,
+        })
 
         # Return 1-indexed chamber number for display
         return survived, chamber + 1
@@ -62,20 +89,10 @@ class RussianRoulette:
         As chambers are used without hitting the bullet,
         the probability of hitting decreases (remaining chambers).
         """
-        # How many chambers have we gone through?
-        chambers_checked = self.state.shots_fired
-
-        # If we've checked chambers without finding the bullet,
-        # the probability changes based on remaining chambers
-        remaining_chambers = self.state.chambers - chambers_checked
-
-        if remaining_chambers <= 0:
-            # This shouldn't happen in normal play
-            return 0.0
-
-        # Probability of survival = (remaining - 1) / remaining
-        # Because 1 of the remaining chambers has the bullet
-        return (remaining_chambers - 1) / remaining_chambers
+        shots_fired = self.state.shots_fired
+        if self.state.chambers == ROULETTE_CHAMBERS and shots_fired < ROULETTE_CHAMBERS:
+            return _SURVIVAL_LUT[shots_fired]
+        return _survival_probability(self.state.chambers, shots_fired)
 
     def get_death_probability(self) -> float:
         """Get the probability of being eliminated on the next shot"""
@@ -86,5 +103,5 @@ class RussianRoulette:
         return self.state.shots_fired
 
     def get_state(self) -> RouletteState:
-        """Get current roulette state"""
-        return self.state.model_copy()
+        """Get current roulette state (frozen, safe to share)"""
+        return self.state
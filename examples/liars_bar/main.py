@@ -27,16 +27,19 @@ from agents.ai_agent import AIAgent
 from agents.personalities import AGENT_CONFIGS
 from memory.memorize import (
     create_game_over_event,
-    memorize_game_events,
+    queue_game_events,
 )
 from ui.terminal import TerminalUI
 from ui.ascii_art import TITLE_SIMPLE
 
 
+# Minimum length of an AI turn in seconds, so the human can follow along
+AI_TURN_DELAY = 1.0
+
+
 async def get_input(prompt: str) -> str:
     """Get user input asynchronously"""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, lambda: input(prompt).strip())
+    return (await asyncio.to_thread(input, prompt)).strip()
 
 
 async def select_game_mode(ui: TerminalUI) -> GameMode:
@@ -64,7 +67,9 @@ async def select_game_mode(ui: TerminalUI) -> GameMode:
             print("Invalid choice. Please enter 1 or 2.")
 
 
-async def setup_game(ui: TerminalUI) -> tuple[GameEngine, list[BaseAgent]]:
+async def setup_game(
+    ui: TerminalUI
+) -> tuple[GameEngine, list[BaseAgent], dict[str, BaseAgent]]:
     """Set up the game with players"""
     # Check for API key
     api_key = os.getenv("OPENROUTER_API_KEY")
@@ -129,30 +134,40 @@ async def setup_game(ui: TerminalUI) -> tuple[GameEngine, list[BaseAgent]]:
     # Create game engine
     engine = GameEngine(mode=mode, players=players)
 
-    return engine, agents
+    # Agent lookup by player ID, built once for run_turn
+    agents_by_id = {agent.player_id: agent for agent in agents}
+
+    return engine, agents, agents_by_id
+
+
+async def notify_round_start(engine: GameEngine, agents: list[BaseAgent]) -> None:
+    """Tell every agent a new round has started"""
+    state = engine.get_game_state_readonly()
+    await asyncio.gather(*(agent.on_round_start(state) for agent in agents))
 
 
-def get_agent_for_player(agents: list[BaseAgent], player_id: str) -> BaseAgent | None:
+def get_agent_for_player(
+    agents_by_id: dict[str, BaseAgent],
+    player_id: str
+) -> BaseAgent | None:
     """Find the agent for a given player ID"""
-    for agent in agents:
-        if agent.player_id == player_id:
-            return agent
-    return None
+    return agents_by_id.get(player_id)
 
 
 async def run_turn(
     engine: GameEngine,
     agents: list[BaseAgent],
-    ui: TerminalUI
+    ui: TerminalUI,
+    agents_by_id: dict[str, BaseAgent]
 ) -> bool:
     """
     Run a single turn.
 
     Returns True if the game should continue, False if over.
     """
-    state = engine.get_game_state()
+    state = engine.get_game_state_readonly()
     current_player = engine.get_current_player()
-    current_agent = get_agent_for_player(agents, current_player.id)
+    current_agent = get_agent_for_player(agents_by_id, current_player.id)
 
     if not current_agent:
         ui.show_error(f"No agent found for player {current_player.id}")
@@ -181,26 +196,28 @@ async def run_turn(
             result = await engine.handle_challenge(current_player, previous_player)
 
             # Show result
-            ui.render_challenge_result(result, engine.get_game_state())
+            ui.render_challenge_result(result, engine.get_game_state_readonly())
 
-            # Notify all agents
-            for agent in agents:
+            # Notify all agents concurrently, each in challenge -> elimination order
+            async def notify_challenge(agent: BaseAgent) -> None:
                 await agent.on_challenge(
                     result.challenger_id,
                     result.challenged_id,
                     result.was_bluff,
                     result.loser_id,
                     result.roulette_result == "survived",
-                    engine.get_game_state()
+                    engine.get_game_state_readonly()
                 )
 
                 if result.roulette_result == "eliminated":
                     await agent.on_elimination(
                         result.loser_id,
                         result.challenger_id if result.was_bluff else result.challenged_id,
-                        engine.get_game_state()
+                        engine.get_game_state_readonly()
                     )
 
+            await asyncio.gather(*(notify_challenge(agent) for agent in agents))
+
             # Check for game over
             if engine.check_game_over():
                 return False
@@ -209,8 +226,7 @@ async def run_turn(
             engine.setup_round()
 
             # Notify round start
-            for agent in agents:
-                await agent.on_round_start(engine.get_game_state())
+            await notify_round_start(engine, agents)
 
             if current_player.is_human:
                 ui.wait_for_enter()
@@ -221,7 +237,14 @@ async def run_turn(
     if not current_player.is_human:
         ui.show_thinking(current_player.name)
 
-    action = await current_agent.decide_action(state)
+    if current_player.is_human:
+        action = await current_agent.decide_action(state)
+    else:
+        # Overlap the pacing delay with the AI's thinking instead of adding it
+        action, _ = await asyncio.gather(
+            current_agent.decide_action(state),
+            asyncio.sleep(AI_TURN_DELAY),
+        )
 
     # Process the action
     if state.mode == GameMode.LIARS_DECK:
@@ -234,25 +257,22 @@ async def run_turn(
         return True
 
     # Show the action
-    ui.render_action(action, engine.get_game_state())
+    ui.render_action(action, engine.get_game_state_readonly())
 
     # Notify all agents
-    for agent in agents:
-        await agent.on_action(current_player.id, action, engine.get_game_state())
+    state = engine.get_game_state_readonly()
+    await asyncio.gather(*(
+        agent.on_action(current_player.id, action, state) for agent in agents
+    ))
 
     # Check if round is over (only for deck mode when cards run out)
     if engine.check_round_over():
         engine.setup_round()
-        for agent in agents:
-            await agent.on_round_start(engine.get_game_state())
+        await notify_round_start(engine, agents)
 
     # Advance to next player
     engine.advance_turn()
 
-    # Brief pause for AI turns
-    if not current_player.is_human:
-        await asyncio.sleep(1)
-
     return True
 
 
@@ -262,23 +282,21 @@ async def main():
 
     try:
         # Setup
-        engine, agents = await setup_game(ui)
+        engine, agents, agents_by_id = await setup_game(ui)
 
         # Notify game start
-        initial_state = engine.get_game_state()
-        for agent in agents:
-            await agent.on_game_start(initial_state)
+        initial_state = engine.get_game_state_readonly()
+        await asyncio.gather(*(agent.on_game_start(initial_state) for agent in agents))
 
         # Setup first round
         engine.setup_round()
 
         # Notify round start
-        for agent in agents:
-            await agent.on_round_start(engine.get_game_state())
+        await notify_round_start(engine, agents)
 
         # Main game loop
         while True:
-            continue_game = await run_turn(engine, agents, ui)
+            continue_game = await run_turn(engine, agents, ui, agents_by_id)
 
             if not continue_game:
                 break
@@ -290,31 +308,38 @@ async def main():
         # Game over
         winner = engine.get_winner()
         if winner:
-            ui.render_game_over(winner, engine.get_game_state())
+            ui.render_game_over(winner, engine.get_game_state_readonly())
 
             # Notify all agents
-            for agent in agents:
-                await agent.on_game_over(winner.id, engine.get_game_state())
+            final_state = engine.get_game_state_readonly()
+            await asyncio.gather(*(agent.on_game_over(winner.id, final_state) for agent in agents))
 
             # Memorize final game state
             game_events = [
                 create_game_over_event(
                     winner.id,
-                    engine.get_game_state().round_number,
+                    engine.get_game_state_readonly().round_number,
                     {
                         p.id: {
                             "survived": p.is_alive(),
                             "bullets_survived": p.bullets_survived
                         }
-                        for p in engine.get_game_state().players
+                        for p in engine.get_game_state_readonly().players
                     }
                 )
             ]
 
-            # Memorize for all AI agents
+            # Queued alongside each agent's own events, so they upload together
             for agent in agents:
                 if isinstance(agent, AIAgent):
-                    await memorize_game_events(game_events, agent.player_id)
+                    queue_game_events(game_events, agent.player_id)
+
+            # Let the queued memorization complete
+            await AIAgent.wait_for_background_tasks()
+
+        # Release agent resources (HTTP client, input thread)
+        for agent in agents:
+            await agent.aclose()
 
         print("\nThanks for playing Liar's Bar!")
 
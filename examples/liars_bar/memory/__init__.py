@@ -8,11 +8,15 @@ from .config import memorize_config, retrieve_config
 from .common import get_memory_service, reset_memory_service
 from .memorize import (
     memorize_game_events,
+    memorize_game_events_batch,
+    queue_game_events,
+    drain_memorize_queue,
     retrieve_memories,
     create_bluff_event,
     create_challenge_event,
     create_elimination_event,
     create_game_over_event,
+    set_event_clock,
 )
 
 __all__ = [
@@ -21,9 +25,13 @@ __all__ = [
     "get_memory_service",
     "reset_memory_service",
     "memorize_game_events",
+    "memorize_game_events_batch",
+    "queue_game_events",
+    "drain_memorize_queue",
     "retrieve_memories",
     "create_bluff_event",
     "create_challenge_event",
     "create_elimination_event",
     "create_game_over_event",
+    "set_event_clock",
 ]
@@ -6,27 +6,30 @@ Configured with OpenRouter LLM profiles for different AI agents.
 """
 
 import os
+from functools import cache
 from typing import Any
 
-# Try to import MemoryService, but don't fail if not available
-try:
-    from memu.app import MemoryService
-    MEMU_AVAILABLE = True
-except ImportError:
-    MEMU_AVAILABLE = False
-    MemoryService = None
-
 from .config import memorize_config, retrieve_config
 
 
-# Singleton instance
-_SHARED_MEMORY_SERVICE: Any = None
-
-
 def get_memory_service() -> Any:
     """
     Get or create the shared MemoryService instance.
 
+    Returns:
+        MemoryService instance or None if memu is not available
+    """
+    return _init_memory_service()
+
+
+@cache
+def _init_memory_service() -> Any:
+    """
+    Create the MemoryService once; the result (even None) is cached.
+
+    memu is imported here rather than at module load, so games without
+    memory never pay for its import.
+
     Uses OpenRouter for all LLM profiles with different models:
     - default: Claude 3.5 Sonnet (for memory operations)
     - claude_agent: Claude 3.5 Sonnet
@@ -36,26 +39,26 @@ def get_memory_service() -> Any:
     Returns:
         MemoryService instance or None if memu is not available
     """
-    global _SHARED_MEMORY_SERVICE
-
-    if not MEMU_AVAILABLE:
-        print("[Warning] memu package not available, memory features disabled")
-        return None
-
-    if _SHARED_MEMORY_SERVICE is not None:
-        return _SHARED_MEMORY_SERVICE
-
     api_key = os.getenv("OPENROUTER_API_KEY")
     if not api_key:
         print("[Warning] OPENROUTER_API_KEY not set, memory features disabled")
         return None
 
+    # Import MemoryService, but don't fail if not available
     try:
-        _SHARED_MEMORY_SERVICE = MemoryService(
+        from memu.app import MemoryService
+    except ImportError:
+        print("[Warning] memu package not available, memory features disabled")
+        return None
+
+    try:
+        # The SDK backend keeps one pooled client per profile, while the
+        # httpx backend opens a fresh connection for every request
+        memory_service = MemoryService(
             llm_profiles={
                 "default": {
                     "provider": "openrouter",
-                    "client_backend": "httpx",
+                    "client_backend": "sdk",
                     "base_url": "https://openrouter.ai/api/v1",
                     "api_key": api_key,
                     "chat_model": "anthropic/claude-3.5-sonnet",
@@ -63,7 +66,7 @@ def get_memory_service() -> Any:
                 },
                 "claude_agent": {
                     "provider": "openrouter",
-                    "client_backend": "httpx",
+                    "client_backend": "sdk",
                     "base_url": "https://openrouter.ai/api/v1",
                     "api_key": api_key,
                     "chat_model": "anthropic/claude-3.5-sonnet",
@@ -71,7 +74,7 @@ def get_memory_service() -> Any:
                 },
                 "gpt_agent": {
                     "provider": "openrouter",
-                    "client_backend": "httpx",
+                    "client_backend": "sdk",
                     "base_url": "https://openrouter.ai/api/v1",
                     "api_key": api_key,
                     "chat_model": "openai/gpt-4o",
@@ -79,7 +82,7 @@ def get_memory_service() -> Any:
                 },
                 "llama_agent": {
                     "provider": "openrouter",
-                    "client_backend": "httpx",
+                    "client_backend": "sdk",
                     "base_url": "https://openrouter.ai/api/v1",
                     "api_key": api_key,
                     "chat_model": "meta-llama/llama-3.1-70b-instruct",
@@ -92,12 +95,11 @@ def get_memory_service() -> Any:
         print("[Memory] MemoryService initialized successfully")
     except Exception as e:
         print(f"[Warning] Failed to initialize MemoryService: {e}")
-        _SHARED_MEMORY_SERVICE = None
+        return None
 
-    return _SHARED_MEMORY_SERVICE
+    return memory_service
 
 
 def reset_memory_service() -> None:
     """Reset the memory service singleton (for testing)"""
-    global _SHARED_MEMORY_SERVICE
-    _SHARED_MEMORY_SERVICE = None
+    _init_memory_service.cache_clear()
@@ -4,15 +4,28 @@ Memory Configuration for Liar's Bar
 Defines memory categories, types, and prompts for AI agents.
 """
 
+from types import MappingProxyType
+from typing import Any
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 # Memory types for game events
-MEMORY_TYPES = [
+MEMORY_TYPES = (
     "game_event",
     "strategy",
     "player_profile"
-]
+)
 
 # Memory type prompts for extraction
-MEMORY_TYPE_PROMPTS = {
+MEMORY_TYPE_PROMPTS = _freeze({
     "game_event": {
         "objective": {
             "ordinal": 10,
@@ -115,10 +128,10 @@ Track for each player:
 </item>"""
         }
     }
-}
+})
 
 # Memory categories for organizing memories
-MEMORY_CATEGORIES = [
+MEMORY_CATEGORIES = _freeze([
     {
         "name": "bluff_history",
         "description": "History of bluffs made and their outcomes - who bluffed, what they claimed, if they were caught",
@@ -159,21 +172,23 @@ MEMORY_CATEGORIES = [
         "description": "Overall game statistics and trends - win rates, elimination patterns, round outcomes",
         "target_length": 300
     }
-]
+])
+
+# Configs are read-only, so they can be shared and used in cache keys safely
 
 # Memorize configuration
-memorize_config = {
+memorize_config = MappingProxyType({
     "memory_types": MEMORY_TYPES,
     "memory_type_prompts": MEMORY_TYPE_PROMPTS,
     "memory_categories": MEMORY_CATEGORIES,
-}
+})
 
 # Retrieve configuration
-retrieve_config = {
+retrieve_config = _freeze({
     "method": "rag",
     "route_intention": False,
     "sufficiency_check": False,
     "category": {"enabled": True, "top_k": 5},
     "item": {"enabled": True, "top_k": 10},
     "resource": {"enabled": False}
-}
+})
@@ -4,17 +4,56 @@ Game Event Memorization
 Functions to store game events in the MemoryService for AI learning.
 """
 
+import asyncio
+import hashlib
 import json
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+# orjson serializes event dumps much faster, but is optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+from .cache import LLMCache
 from .common import get_memory_service
 
 
 # Data directory for memory resources
 DATA_DIR = Path(__file__).parent / "data"
 
+# Exact-match caches in front of the MemoryService
+_MEMORIZE_CACHE = LLMCache(maxsize=256, ttl=24 * 3600.0)
+_RETRIEVE_CACHE = LLMCache(maxsize=1024, ttl=3600.0)
+
+# Bumped when an agent memorizes, so its older retrieval results miss
+_MEMORY_GENERATION: dict[str, int] = {}
+
+# Paths of recently written dumps by content digest, to skip the worker-thread write
+_DUMPED_PATHS: OrderedDict[str, str] = OrderedDict()
+_DUMPED_PATHS_SIZE = 256
+
+# Bounded queue of (events, agent_id) uploads drained by a background worker
+_MEMORIZE_QUEUE_SIZE = 32
+_MEMORIZE_QUEUE: asyncio.Queue | None = None
+_MEMORIZE_WORKER: asyncio.Task | None = None
+
+# Seconds the worker waits to merge uploads queued around the same time
+_MEMORIZE_COALESCE_WINDOW = 0.1
+
+# Event timestamps are reused for this many seconds before reformatting
+_NOW_ISO_RESOLUTION = 1e-3
+_now_iso_cache: tuple[float, str] = (float("-inf"), "")
+
+# Optional fixed clock for deterministic replays
+_event_clock: Callable[[], str] | None = None
+
 
 def ensure_data_dir() -> Path:
     """Ensure the data directory exists"""
@@ -22,6 +61,32 @@ def ensure_data_dir() -> Path:
     return DATA_DIR
 
 
+def _now_iso() -> str:
+    """Current time in ISO format, refreshed at most once per millisecond"""
+    global _now_iso_cache
+
+    if _event_clock is not None:
+        return _event_clock()
+
+    stamp, iso = _now_iso_cache
+    now = time.monotonic()
+    if now - stamp > _NOW_ISO_RESOLUTION:
+        iso = datetime.now().isoformat()
+        _now_iso_cache = (now, iso)
+    return iso
+
+
+def set_event_clock(clock: Callable[[], str] | None) -> None:
+    """
+    Override the clock used for event timestamps.
+
+    Args:
+        clock: Function returning an ISO timestamp, or None for the wall clock
+    """
+    global _event_clock
+    _event_clock = clock
+
+
 def format_game_event(
     event_type: str,
     player_id: str | None = None,
@@ -32,17 +97,22 @@ def format_game_event(
         "event_type": event_type,
         "player_id": player_id,
         "details": details or {},
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 
-def dump_events_to_file(
+async def dump_events_to_file(
     events: list[dict[str, Any]],
     agent_id: str
 ) -> str | None:
     """
     Save game events to a JSON file for memorization.
 
+    Files are named by a hash of their events without the wall-clock
+    timestamps, so replaying the same game reuses the existing file instead
+    of writing a new one. The disk work runs in a worker thread to keep the
+    event loop free.
+
     Args:
         events: List of game events
         agent_id: ID of the agent these events are for
@@ -51,28 +121,33 @@ def dump_events_to_file(
         Path to the saved file, or None if failed
     """
     try:
-        ensure_data_dir()
-
-        # Format as conversation resource for MemoryService
-        resource_data = {
-            "content": [
-                {
-                    "role": "system",
-                    "content": {"text": json.dumps(event, ensure_ascii=False)},
-                    "created_at": event.get("timestamp", datetime.now().isoformat())
-                }
-                for event in events
-            ]
-        }
-
-        # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"game_{agent_id}_{timestamp}.json"
-        filepath = DATA_DIR / filename
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(resource_data, f, indent=2, ensure_ascii=False)
-
+        # Content-address the file by its events; the timestamp differs on
+        # every run, so it is left out of the hash
+        canonical = [
+            {key: value for key, value in event.items() if key != "timestamp"}
+            for event in events
+        ]
+        if ORJSON_AVAILABLE:
+            blob = orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS)
+        else:
+            blob = json.dumps(
+                canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+            ).encode("utf-8")
+        digest = hashlib.sha256(blob).hexdigest()[:16]
+
+        key = f"{agent_id}:{digest}"
+        cached_path = _DUMPED_PATHS.get(key)
+        if cached_path is not None:
+            # The data directory may have been cleaned since the write
+            if Path(cached_path).exists():
+                _DUMPED_PATHS.move_to_end(key)
+                return cached_path
+            del _DUMPED_PATHS[key]
+
+        filepath = DATA_DIR / f"game_{agent_id}_{digest}.json"
+        await asyncio.to_thread(_write_resource_file, filepath, events)
+
+        _remember_dump(key, filepath.as_posix())
         return filepath.as_posix()
 
     except Exception as e:
@@ -80,6 +155,56 @@ def dump_events_to_file(
         return None
 
 
+def _write_resource_file(filepath: Path, events: list[dict[str, Any]]) -> None:
+    """Write events as a conversation resource, unless the file already exists"""
+    if filepath.exists():
+        return
+
+    ensure_data_dir()
+    now_iso = _now_iso()
+
+    # The timestamp already goes in created_at, which MemoryService prefixes
+    # to each message, so leave it out of the message text
+    if ORJSON_AVAILABLE:
+        def encode_event(event: dict[str, Any]) -> str:
+            return orjson.dumps(
+                {key: value for key, value in event.items() if key != "timestamp"}
+            ).decode()
+    else:
+        def encode_event(event: dict[str, Any]) -> str:
+            return json.dumps(
+                {key: value for key, value in event.items() if key != "timestamp"},
+                ensure_ascii=False
+            )
+
+    # Format as conversation resource for MemoryService
+    resource_data = {
+        "content": [
+            {
+                "role": "system",
+                "content": {"text": encode_event(event)},
+                "created_at": event.get("timestamp", now_iso)
+            }
+            for event in events
+        ]
+    }
+
+    # Compact output; MemoryService reads the file back as plain UTF-8 text
+    if ORJSON_AVAILABLE:
+        filepath.write_bytes(orjson.dumps(resource_data))
+    else:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(resource_data, f, separators=(",", ":"), ensure_ascii=False)
+
+
+def _remember_dump(key: str, path: str) -> None:
+    """Record a written dump, keeping only the most recent ones"""
+    _DUMPED_PATHS[key] = path
+    _DUMPED_PATHS.move_to_end(key)
+    while len(_DUMPED_PATHS) > _DUMPED_PATHS_SIZE:
+        _DUMPED_PATHS.popitem(last=False)
+
+
 async def memorize_game_events(
     events: list[dict[str, Any]],
     agent_id: str
@@ -98,8 +223,14 @@ async def memorize_game_events(
     if memory_service is None:
         return None
 
+    # Identical events were already uploaded for this agent
+    cache_key = LLMCache.cache_key(agent_id, events)
+    cached = _MEMORIZE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Save events to file
-    resource_url = dump_events_to_file(events, agent_id)
+    resource_url = await dump_events_to_file(events, agent_id)
     if resource_url is None:
         return None
 
@@ -110,6 +241,9 @@ async def memorize_game_events(
             user={"agent_id": agent_id}
         )
         print(f"[Memory] Memorized {len(events)} events for {agent_id}")
+        _MEMORY_GENERATION[agent_id] = _MEMORY_GENERATION.get(agent_id, 0) + 1
+        if result is not None:
+            _MEMORIZE_CACHE.set(cache_key, result)
         return result
 
     except Exception as e:
@@ -117,6 +251,89 @@ async def memorize_game_events(
         return None
 
 
+async def memorize_game_events_batch(
+    batches: list[tuple[list[dict[str, Any]], str]]
+) -> list[dict[str, Any] | None]:
+    """
+    Memorize several agents' events concurrently.
+
+    Args:
+        batches: (events, agent_id) pairs, one per agent
+
+    Returns:
+        Memorization results in the same order as batches
+    """
+    if not batches or get_memory_service() is None:
+        return [None] * len(batches)
+
+    return list(await asyncio.gather(*(
+        memorize_game_events(events, agent_id) for events, agent_id in batches
+    )))
+
+
+async def _memorize_worker(queue: asyncio.Queue) -> None:
+    """Upload queued events, merging what arrives together per agent"""
+    while True:
+        batch = [await queue.get()]
+
+        # Let the other uploads from the same moment arrive, then take them all
+        await asyncio.sleep(_MEMORIZE_COALESCE_WINDOW)
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+
+        try:
+            # One upload per agent instead of one per queued event list
+            merged: dict[str, list[dict[str, Any]]] = {}
+            for events, agent_id in batch:
+                merged.setdefault(agent_id, []).extend(events)
+            await memorize_game_events_batch(
+                [(events, agent_id) for agent_id, events in merged.items()]
+            )
+        except Exception as e:
+            # Keep the worker alive for the rest of the queue
+            print(f"[Memory] Memorization failed: {e}")
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+def queue_game_events(events: list[dict[str, Any]], agent_id: str) -> None:
+    """
+    Queue game events for memorization without waiting for the upload.
+
+    If the queue is full, the oldest pending upload is dropped.
+
+    Args:
+        events: List of game events to memorize
+        agent_id: ID of the agent
+    """
+    global _MEMORIZE_QUEUE, _MEMORIZE_WORKER
+
+    if get_memory_service() is None:
+        return
+
+    # Start the worker on first use, inside the running event loop
+    if _MEMORIZE_QUEUE is None:
+        _MEMORIZE_QUEUE = asyncio.Queue(maxsize=_MEMORIZE_QUEUE_SIZE)
+    if _MEMORIZE_WORKER is None or _MEMORIZE_WORKER.done():
+        _MEMORIZE_WORKER = asyncio.create_task(_memorize_worker(_MEMORIZE_QUEUE))
+
+    item = (list(events), agent_id)
+    try:
+        _MEMORIZE_QUEUE.put_nowait(item)
+    except asyncio.QueueFull:
+        _, dropped_id = _MEMORIZE_QUEUE.get_nowait()
+        _MEMORIZE_QUEUE.task_done()
+        print(f"[Memory] Queue full, dropped pending events for {dropped_id}")
+        _MEMORIZE_QUEUE.put_nowait(item)
+
+
+async def drain_memorize_queue() -> None:
+    """Wait until every queued memorization has been uploaded"""
+    if _MEMORIZE_QUEUE is not None and _MEMORIZE_WORKER is not None:
+        await _MEMORIZE_QUEUE.join()
+
+
 async def retrieve_memories(
     query: str,
     agent_id: str,
@@ -137,12 +354,21 @@ async def retrieve_memories(
     if memory_service is None:
         return []
 
+    cache_key = LLMCache.cache_key(
+        agent_id, _MEMORY_GENERATION.get(agent_id, 0), query, top_k
+    )
+    cached = _RETRIEVE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         result = await memory_service.retrieve(
             queries=[{"role": "user", "content": query}],
             where={"agent_id": agent_id}
         )
-        return result.get("items", [])[:top_k]
+        items = result.get("items", [])[:top_k]
+        _RETRIEVE_CACHE.set(cache_key, items)
+        return items
 
     except Exception as e:
         print(f"[Memory] Retrieval failed: {e}")
@@ -182,6 +182,25 @@ CHARACTER_ICONS = {
 }
 
 
+# Art split into rows once, for side-by-side rendering
+CARD_ART_LINES: dict[CardType, tuple[str, ...]] = {
+    card: tuple(art.strip().split("\n")) for card, art in CARD_ART.items()
+}
+CARD_BACK_LINES: tuple[str, ...] = tuple(CARD_BACK.strip().split("\n"))
+DICE_ART_LINES: dict[int, tuple[str, ...]] = {
+    value: tuple(art.strip().split("\n")) for value, art in DICE_ART.items()
+}
+
+# Per-face lookups for dice rows, indexed directly by the die value (1-6).
+# Index 0 holds the fallback so the tuples line up with face numbers.
+_DICE_UNICODE_BY_FACE: tuple[str, ...] = ("?",) + tuple(
+    DICE_UNICODE[face] for face in range(1, 7)
+)
+_DICE_ART_LINES_BY_FACE: tuple[tuple[str, ...], ...] = (DICE_ART_LINES[1],) + tuple(
+    DICE_ART_LINES[face] for face in range(1, 7)
+)
+
+
 def get_card_art(card: CardType) -> str:
     """Get ASCII art for a card"""
     return CARD_ART.get(card, CARD_BACK)
@@ -199,12 +218,14 @@ def get_dice_unicode(value: int) -> str:
 
 def format_dice_row(dice: list[int]) -> str:
     """Format a row of dice as Unicode"""
-    return " ".join(get_dice_unicode(d) for d in dice)
+    # Range-check first: a negative value would otherwise index from the end
+    faces = _DICE_UNICODE_BY_FACE
+    return " ".join([faces[d] if 1 <= d <= 6 else faces[0] for d in dice])
 
 
 def get_cards_inline(cards: list[CardType]) -> str:
     """Format cards inline"""
-    return " ".join(SMALL_CARD.get(c, "[?]") for c in cards)
+    return " ".join([SMALL_CARD.get(c, "[?]") for c in cards])
 
 
 def get_character_icon(character: str) -> str:
@@ -217,16 +238,9 @@ def print_horizontal_cards(cards: list[CardType]) -> str:
     if not cards:
         return ""
 
-    # Get art for each card
-    arts = [CARD_ART.get(c, CARD_BACK).strip().split("\n") for c in cards]
-
-    # Combine lines
-    result = []
-    for row_idx in range(len(arts[0])):
-        row = "  ".join(art[row_idx] for art in arts)
-        result.append(row)
-
-    return "\n".join(result)
+    # Get art for each card, then combine row by row
+    arts = [CARD_ART_LINES.get(c, CARD_BACK_LINES) for c in cards]
+    return "\n".join(["  ".join(row) for row in zip(*arts)])
 
 
 def print_horizontal_dice(dice: list[int]) -> str:
@@ -234,13 +248,7 @@ def print_horizontal_dice(dice: list[int]) -> str:
     if not dice:
         return ""
 
-    # Get art for each die
-    arts = [DICE_ART.get(d, DICE_ART[1]).strip().split("\n") for d in dice]
-
-    # Combine lines
-    result = []
-    for row_idx in range(len(arts[0])):
-        row = "  ".join(art[row_idx] for art in arts)
-        result.append(row)
-
-    return "\n".join(result)
+    # Get art for each die, then combine row by row
+    faces = _DICE_ART_LINES_BY_FACE
+    arts = [faces[d] if 1 <= d <= 6 else faces[0] for d in dice]
+    return "\n".join(["  ".join(row) for row in zip(*arts)])
@@ -4,12 +4,15 @@ Terminal UI for Liar's Bar
 Handles all terminal display and formatting.
 """
 
+import functools
 import os
 import sys
-from typing import TYPE_CHECKING
+import unicodedata
+from typing import Callable, TypeVar
 
 from game.constants import GameMode, PlayerStatus
-from game.models import GameState, Player, ChallengeResult
+from game.models import GameState, Player, ChallengeResult, DeckAction, DiceAction
+from game.roulette import death_probability
 from .ascii_art import (
     TITLE_SIMPLE,
     PLAYER_ALIVE,
@@ -24,8 +27,100 @@ from .ascii_art import (
     REVOLVER_CLICK,
 )
 
-if TYPE_CHECKING:
-    from game.models import DeckAction, DiceAction
+F = TypeVar("F", bound=Callable[..., None])
+
+# ANSI: clear screen and scrollback, then move the cursor home (same as `clear`)
+CLEAR_SCREEN = "\x1b[2J\x1b[3J\x1b[H"
+
+# ASCII stand-ins for terminals that can't show emoji (or box drawing). Wide
+# emoji get two characters so centered and aligned text keeps its columns.
+_ASCII_FALLBACK = str.maketrans({
+    "🎭": "<>", "🃏": "[]", "🎲": "::", "🔫": "!!", "👑": "^^", "💀": "xx",
+    "🤔": "..", "❌": "!!", "👥": "@@", "📢": ">>", "🎉": "**", "👉": "->",
+    "💥": "**", "🍺": "  ", "👤": "Me", "🤖": "AI", "🧠": "AI", "🦙": "AI",
+    "🐶": "@@", "🦊": "@@", "🐷": "@@", "🐂": "@@",
+    "ℹ": "i", "\ufe0f": None, "✓": "+", "★": "*", "♠": "S", "•": "*", "→": ">",
+    "⚀": "1", "⚁": "2", "⚂": "3", "⚃": "4", "⚄": "5", "⚅": "6",
+    "─": "-", "│": "|", "┌": "+", "┐": "+", "└": "+", "┘": "+",
+    "═": "=", "║": "|", "╔": "+", "╗": "+", "╚": "+", "╝": "+",
+    "●": "*", "○": "o", "█": "#", "░": ".",
+})
+
+
+def _supports_emoji() -> bool:
+    """Best guess at whether stdout can display emoji"""
+    encoding = getattr(sys.stdout, "encoding", None)
+    if encoding is None:
+        return True  # In-memory text stream; takes any str
+    if not encoding.lower().replace("-", "").startswith("utf"):
+        return False
+    if os.name == 'nt':
+        # Legacy console fonts lack emoji; Windows Terminal sets WT_SESSION
+        return "WT_SESSION" in os.environ
+    return True
+
+
+def _enable_windows_ansi() -> None:
+    """Turn on ANSI escape handling in the Windows console"""
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+    except (AttributeError, OSError):
+        pass
+
+
+def _renders(method: F) -> F:
+    """Buffer a method's output and write it in one go when the outermost call returns"""
+    @functools.wraps(method)
+    def wrapper(self: "TerminalUI", *args, **kwargs) -> None:
+        self._depth += 1
+        try:
+            method(self, *args, **kwargs)
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.flush()
+    return wrapper  # type: ignore[return-value]
+
+
+def _display_width(text: str) -> int:
+    """Terminal columns taken by text, counting wide characters (emoji) as two"""
+    return len(text) + sum(1 for ch in text if unicodedata.east_asian_width(ch) in "WF")
+
+
+def _center(text: str, width: int) -> str:
+    """Center text within a number of terminal columns"""
+    pad = width - _display_width(text)
+    if pad <= 0:
+        return text
+    left = pad // 2
+    return " " * left + text + " " * (pad - left)
+
+
+@functools.lru_cache(maxsize=64)
+def _rule(char: str, width: int) -> str:
+    """A horizontal rule, built once per (char, width)"""
+    return char * width
+
+
+@functools.lru_cache(maxsize=64)
+def _roulette_block(shots: int, chambers: int) -> str:
+    """Cylinder, shot count and odds lines, formatted once per (shots, chambers)"""
+    # Visual representation: fired chambers empty (○), the rest loaded (●)
+    fired = min(shots, chambers)
+    chamber_display = "○ " * fired + "● " * (chambers - fired)
+    death_prob = death_probability(chambers, shots) * 100
+    return (
+        f"  Chambers: {chamber_display}\n"
+        f"  Shots fired: {shots}/{chambers}\n"
+        f"  Next shot death probability: {death_prob:.0f}%"
+    )
 
 
 class TerminalUI:
@@ -43,227 +138,270 @@ class TerminalUI:
     def __init__(self):
         self.width = 60  # Default terminal width
 
+        # Pending output, written with a single write() per top-level render
+        self._buf: list[str] = []
+        self._depth = 0
+
+        # Action description by exact action type
+        self._action_formatters: dict[type, Callable[..., str]] = {
+            DeckAction: self._format_deck_action,
+            DiceAction: self._format_dice_action,
+        }
+
+        if os.name == 'nt':  # Windows needs VT mode for the clear sequence
+            _enable_windows_ansi()
+
+        # Probed once; when False, output is transliterated at flush time
+        self._emoji = _supports_emoji()
+
+    def _emit(self, text: str = "") -> None:
+        """Queue a line of output"""
+        self._buf.append(text)
+        self._buf.append("\n")
+
+    def flush(self) -> None:
+        """Write all pending output to stdout"""
+        if self._buf:
+            out = sys.stdout
+            text = "".join(self._buf)
+            self._buf.clear()
+
+            if not self._emoji:
+                # One translate pass per write, then replace anything the
+                # console encoding still can't represent
+                text = text.translate(_ASCII_FALLBACK)
+                encoding = getattr(out, "encoding", None)
+                if encoding:
+                    text = text.encode(encoding, "replace").decode(encoding)
+
+            out.write(text)
+            out.flush()
+
+    @_renders
     def clear_screen(self) -> None:
         """Clear the terminal screen"""
-        if os.name == 'nt':  # Windows
-            os.system('cls')
-        else:  # Unix/Linux/Mac
-            os.system('clear')
+        # An escape sequence instead of spawning a cls/clear process
+        self._buf.append(CLEAR_SCREEN)
 
+    @_renders
     def print_line(self, char: str = "─", width: int | None = None) -> None:
         """Print a horizontal line"""
-        w = width or self.width
-        print(char * w)
+        self._emit(self.line(char, width))
 
+    @_renders
     def print_centered(self, text: str, width: int | None = None) -> None:
         """Print centered text"""
         w = width or self.width
-        print(text.center(w))
+        self._emit(text.center(w))
 
+    @_renders
     def print_title(self) -> None:
         """Print the game title"""
-        print(TITLE_SIMPLE)
+        self._emit(TITLE_SIMPLE)
 
+    @_renders
     def render_game_header(self, state: GameState) -> None:
         """Render the game header with mode and round info"""
         mode_name = "LIAR'S DECK" if state.mode == GameMode.LIARS_DECK else "LIAR'S DICE"
 
-        print("╔" + "═" * (self.width - 2) + "╗")
-        self.print_centered(f"║  🎭 LIAR'S BAR - {mode_name} 🎭  ║")
-        self.print_centered(f"║  Round: {state.round_number}  ║")
-        print("╚" + "═" * (self.width - 2) + "╝")
+        # Center the titles inside the box so its sides line up with the edges
+        inner = self.width - 2
+        self._emit("\n".join([
+            self._box_edge("╔", "╗"),
+            "║" + _center(f"🎭 LIAR'S BAR - {mode_name} 🎭", inner) + "║",
+            "║" + _center(f"Round: {state.round_number}", inner) + "║",
+            self._box_edge("╚", "╝"),
+        ]))
 
+    @_renders
     def render_players(self, state: GameState, current_player_id: str | None = None) -> None:
         """Render player list with status"""
-        print("\n👥 PLAYERS:")
-        print(self.line("─", 40))
+        self._emit("\n👥 PLAYERS:")
+        self._emit(self.line("─", 40))
+
+        # The current player doesn't change while rendering the list
+        current_id = state.get_current_player().id
 
+        lines = []
         for player in state.players:
             # Status icon
-            if player.status == PlayerStatus.ELIMINATED:
-                status = PLAYER_DEAD
-            else:
-                status = PLAYER_ALIVE
+            status = PLAYER_DEAD if player.status == PlayerStatus.ELIMINATED else PLAYER_ALIVE
 
             # Current player indicator
-            is_current = player.id == state.get_current_player().id
-            current = PLAYER_CURRENT if is_current else "  "
+            current = PLAYER_CURRENT if player.id == current_id else "  "
 
             # Character icon
             icon = get_character_icon(player.id)
 
-            # Model info for AI
+            # Model info for AI, without the provider prefix
             model = ""
             if player.model_id:
-                model = f" [{player.model_id.split('/')[-1]}]"
+                model = f" [{player.model_id.rpartition('/')[2]}]"
             elif player.is_human:
                 model = " [Human]"
 
             # Bullets survived
             bullets = f" (survived: {player.bullets_survived})" if player.bullets_survived > 0 else ""
 
-            print(f"  {current} {status} {icon} {player.name}{model}{bullets}")
+            lines.append(f"  {current} {status} {icon} {player.name}{model}{bullets}")
 
-        print()
+        self._emit("\n".join(lines))
+        self._emit()
 
+    @_renders
     def render_deck_state(self, state: GameState, player: Player | None = None) -> None:
         """Render Liar's Deck mode state"""
-        print("\n🃏 DECK MODE:")
-        print(self.line("─", 40))
+        self._emit("\n🃏 DECK MODE:")
+        self._emit(self.line("─", 40))
 
         # Current round target
         if state.current_round_claim:
-            print(f"  Target card: [{state.current_round_claim.value}]")
+            self._emit(f"  Target card: [{state.current_round_claim.value}]")
 
         # Cards on table
-        print(f"  Cards on table: {state.cards_on_table}")
+        self._emit(f"  Cards on table: {state.cards_on_table}")
 
         # Show player's hand if provided
         if player and player.hand:
-            print(f"\n  Your hand: {get_cards_inline(player.hand)}")
-            print(f"  ({len(player.hand)} cards)")
+            self._emit(f"\n  Your hand: {get_cards_inline(player.hand)}")
+            self._emit(f"  ({len(player.hand)} cards)")
 
         # Recent actions
         if state.deck_actions:
-            print("\n  Recent plays:")
-            for action in state.deck_actions[-5:]:
-                actor = state.get_player_by_id(action.player_id)
-                name = actor.name if actor else action.player_id
-                print(f"    • {name}: {action.cards_count} card(s) → [{action.claimed_type.value}]")
+            self._emit("\n  Recent plays:")
+            player_name = self._player_name
+            self._emit("\n".join([
+                f"    • {player_name(state, action.player_id)}: "
+                f"{action.cards_count} card(s) → [{action.claimed_type.value}]"
+                for action in state.deck_actions[-5:]
+            ]))
 
-        print()
+        self._emit()
 
+    @_renders
     def render_dice_state(self, state: GameState, player: Player | None = None) -> None:
         """Render Liar's Dice mode state"""
-        print("\n🎲 DICE MODE:")
-        print(self.line("─", 40))
+        self._emit("\n🎲 DICE MODE:")
+        self._emit(self.line("─", 40))
 
         # Current bid
         if state.current_bid:
             bidder = state.get_player_by_id(state.current_bid.player_id)
             name = bidder.name if bidder else state.current_bid.player_id
-            print(f"  Current bid: {state.current_bid.bid_count}x {state.current_bid.bid_face}'s by {name}")
+            self._emit(f"  Current bid: {state.current_bid.bid_count}x {state.current_bid.bid_face}'s by {name}")
         else:
-            print("  No bid yet - first player starts")
+            self._emit("  No bid yet - first player starts")
 
         # Show player's dice if provided
         if player and player.dice:
-            print(f"\n  Your dice: {format_dice_row(player.dice)}")
-            print(f"  Values: {player.dice}")
+            self._emit(f"\n  Your dice: {format_dice_row(player.dice)}")
+            self._emit(f"  Values: {player.dice}")
 
         # Recent bids
         if state.dice_actions:
-            print("\n  Recent bids:")
-            for action in state.dice_actions[-5:]:
-                bidder = state.get_player_by_id(action.player_id)
-                name = bidder.name if bidder else action.player_id
-                print(f"    • {name}: {action.bid_count}x {action.bid_face}'s")
+            self._emit("\n  Recent bids:")
+            player_name = self._player_name
+            self._emit("\n".join([
+                f"    • {player_name(state, action.player_id)}: "
+                f"{action.bid_count}x {action.bid_face}'s"
+                for action in state.dice_actions[-5:]
+            ]))
 
-        print()
+        self._emit()
 
+    @_renders
     def render_roulette_state(self, state: GameState) -> None:
         """Render Russian roulette state"""
         if state.roulette:
             shots = state.roulette.shots_fired
             chambers = state.roulette.chambers
-            death_prob = (shots + 1) / chambers * 100 if shots < chambers else 100
 
-            print("\n🔫 RUSSIAN ROULETTE:")
-            print(self.line("─", 40))
+            self._emit("\n🔫 RUSSIAN ROULETTE:")
+            self._emit(self.line("─", 40))
 
-            # Visual representation
-            chamber_display = ""
-            for i in range(chambers):
-                if i < shots:
-                    chamber_display += "○ "  # Empty chamber (fired)
-                else:
-                    chamber_display += "● "  # Unfired chamber
-
-            print(f"  Chambers: {chamber_display}")
-            print(f"  Shots fired: {shots}/{chambers}")
-            print(f"  Next shot death probability: {death_prob:.0f}%")
-            print()
+            self._emit(_roulette_block(shots, chambers))
+            self._emit()
 
+    @_renders
     def render_challenge_result(self, result: ChallengeResult, state: GameState) -> None:
         """Render challenge result dramatically"""
-        challenger = state.get_player_by_id(result.challenger_id)
-        challenged = state.get_player_by_id(result.challenged_id)
-        loser = state.get_player_by_id(result.loser_id)
-
-        print("\n" + "!" * self.width)
-        self.print_centered("🔫 CHALLENGE! 🔫")
-        print("!" * self.width)
-
-        c1_name = challenger.name if challenger else result.challenger_id
-        c2_name = challenged.name if challenged else result.challenged_id
-        loser_name = loser.name if loser else result.loser_id
-
-        print(f"\n  {c1_name} challenges {c2_name}!")
-        print()
+        c1_name = self._player_name(state, result.challenger_id)
+        c2_name = self._player_name(state, result.challenged_id)
+        loser_name = self._player_name(state, result.loser_id)
 
         if result.was_bluff:
-            print("  📢 REVEAL: It WAS a BLUFF!")
-            print(f"  {c2_name} was lying!")
+            reveal = f"  📢 REVEAL: It WAS a BLUFF!\n  {c2_name} was lying!"
         else:
-            print("  📢 REVEAL: It was TRUTH!")
-            print(f"  {c1_name} was wrong to challenge!")
-
-        print(f"\n  {loser_name} must face the revolver...")
-        print(f"  Chamber #{result.chamber_number}")
+            reveal = f"  📢 REVEAL: It was TRUTH!\n  {c1_name} was wrong to challenge!"
 
         if result.roulette_result == "survived":
-            print(REVOLVER_CLICK)
-            print("  *CLICK* ... Empty chamber!")
-            print(f"  {loser_name} SURVIVES!")
+            outcome = f"{REVOLVER_CLICK}\n  *CLICK* ... Empty chamber!\n  {loser_name} SURVIVES!"
         else:
-            print(REVOLVER_FIRE)
-            print(f"  {loser_name} is ELIMINATED!")
-
-        print("\n" + "!" * self.width)
+            outcome = f"{REVOLVER_FIRE}\n  {loser_name} is ELIMINATED!"
+
+        # Assemble the whole result as one block around the shared banner
+        banner = self.line("!")
+        self._emit(
+            f"\n{banner}\n{'🔫 CHALLENGE! 🔫'.center(self.width)}\n{banner}\n"
+            f"\n  {c1_name} challenges {c2_name}!\n\n"
+            f"{reveal}\n"
+            f"\n  {loser_name} must face the revolver...\n"
+            f"  Chamber #{result.chamber_number}\n"
+            f"{outcome}\n"
+            f"\n{banner}"
+        )
 
-    def render_action(self, action: "DeckAction | DiceAction", state: GameState) -> None:
+    @_renders
+    def render_action(self, action: DeckAction | DiceAction, state: GameState) -> None:
         """Render an action that was just taken"""
-        from game.models import DeckAction, DiceAction
-
         actor = state.get_player_by_id(action.player_id)
         name = actor.name if actor else action.player_id
 
-        print("\n" + "-" * 40)
+        sep = self.line("-", 40)
+        self._emit()
+        self._emit(sep)
+        self._emit(self._action_formatters[type(action)](action, name))
+        self._emit(sep)
 
-        if isinstance(action, DeckAction):
-            print(f"  {name} plays {action.cards_count} card(s)")
-            print(f"  Claims: [{action.claimed_type.value}]")
-        else:
-            print(f"  {name} bids:")
-            print(f"  {action.bid_count}x {action.bid_face}'s")
+    @staticmethod
+    def _format_deck_action(action: DeckAction, name: str) -> str:
+        """Describe a card play"""
+        return f"  {name} plays {action.cards_count} card(s)\n  Claims: [{action.claimed_type.value}]"
 
-        print("-" * 40)
+    @staticmethod
+    def _format_dice_action(action: DiceAction, name: str) -> str:
+        """Describe a dice bid"""
+        return f"  {name} bids:\n  {action.bid_count}x {action.bid_face}'s"
 
+    @_renders
     def render_game_over(self, winner: Player, state: GameState) -> None:
         """Render game over screen"""
-        print("\n" + "=" * self.width)
+        rule = self.line("=")
+        self._emit()
+        self._emit(rule)
         self.print_centered("🎉 GAME OVER! 🎉")
-        print("=" * self.width)
+        self._emit(rule)
 
         icon = get_character_icon(winner.id)
-        print(f"\n  {icon} WINNER: {winner.name}!")
+        self._emit(f"\n  {icon} WINNER: {winner.name}!")
 
-        print("\n  Final standings:")
-        print(self.line("─", 40))
+        self._emit("\n  Final standings:")
+        self._emit(self.line("─", 40))
 
-        # Sort by elimination order (winner first)
-        sorted_players = sorted(
-            state.players,
-            key=lambda p: 0 if p.id == winner.id else 1
-        )
+        # Winner first, everyone else in seat order (a stable partition)
+        winner_id = winner.id
+        sorted_players = [p for p in state.players if p.id == winner_id]
+        sorted_players += [p for p in state.players if p.id != winner_id]
 
+        emit = self._emit
         for i, p in enumerate(sorted_players, 1):
-            icon = get_character_icon(p.id)
-            status = "👑 WINNER" if p.id == winner.id else "💀 Eliminated"
-            print(f"  {i}. {icon} {p.name} - {status}")
+            status = "👑 WINNER" if p.id == winner_id else "💀 Eliminated"
+            emit(f"  {i}. {get_character_icon(p.id)} {p.name} - {status}")
 
-        print("\n" + "=" * self.width)
+        self._emit()
+        self._emit(rule)
 
+    @_renders
     def render_full_state(
         self,
         state: GameState,
@@ -287,17 +425,29 @@ class TerminalUI:
 
     def line(self, char: str = "─", width: int | None = None) -> str:
         """Return a line string"""
-        w = width or self.width
-        return char * w
+        return _rule(char, width or self.width)
+
+    @staticmethod
+    def _player_name(state: GameState, player_id: str) -> str:
+        """Display name for a player ID, falling back to the ID itself"""
+        player = state.get_player_by_id(player_id)
+        return player.name if player else player_id
+
+    def _box_edge(self, left: str, right: str) -> str:
+        """Return the top or bottom edge of a full-width double-line box"""
+        return left + _rule("═", self.width - 2) + right
 
+    @_renders
     def show_thinking(self, player_name: str) -> None:
         """Show that an AI is thinking"""
-        print(f"\n  🤔 {player_name} is thinking...")
+        self._emit(f"\n  🤔 {player_name} is thinking...")
 
+    @_renders
     def show_error(self, message: str) -> None:
         """Show an error message"""
-        print(f"\n  ❌ Error: {message}")
+        self._emit(f"\n  ❌ Error: {message}")
 
+    @_renders
     def show_info(self, message: str) -> None:
         """Show an info message"""
-        print(f"\n  ℹ️  {message}")
+        self._emit(f"\n  ℹ️  {message}")